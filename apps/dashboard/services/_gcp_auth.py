@@ -0,0 +1,22 @@
+"""
+GCP Auth Helpers
+Shared service account credentials for the Google Cloud services
+"""
+import functools
+from typing import Tuple
+from google.oauth2 import service_account
+
+
+@functools.lru_cache(maxsize=4)
+def load_credentials(path: str, scopes: Tuple[str, ...] = ()) -> service_account.Credentials:
+    """
+    Load service account credentials once per (path, scopes)
+    
+    Parsing the JSON key and its RSA private key is only done on first use;
+    GeminiService, BigQueryService and CloudRunJobService share the result.
+    Credentials objects are safe to share between threads.
+    """
+    return service_account.Credentials.from_service_account_file(
+        path,
+        scopes=list(scopes) or None
+    )
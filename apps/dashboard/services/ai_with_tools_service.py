@@ -360,7 +360,7 @@ Start your research now. Use tools if you need more information.""")
             }
             
             # Find key pages
-            key_pages = self.web_browser._find_key_pages(url, page_data.get('soup'))
+            key_pages = self.web_browser._find_key_pages(url, page_data.get('soup'), page_data.get('links'))
             if key_pages:
                 result['key_pages'] = key_pages
             
@@ -7,9 +7,9 @@ import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from google.cloud import bigquery
-from google.oauth2 import service_account
 from django.conf import settings
 from django.core.cache import cache
+from apps.dashboard.services._gcp_auth import load_credentials
 import os
 
 logger = logging.getLogger(__name__)
@@ -36,9 +36,9 @@ class BigQueryService:
                 logger.error(f"Credentials file not found: {self.credentials_path}")
                 return None
             
-            credentials = service_account.Credentials.from_service_account_file(
+            credentials = load_credentials(
                 self.credentials_path,
-                scopes=["https://www.googleapis.com/auth/bigquery"]
+                scopes=("https://www.googleapis.com/auth/bigquery",)
             )
             
             client = bigquery.Client(
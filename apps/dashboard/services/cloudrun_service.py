@@ -6,8 +6,8 @@ Ported from Laravel CloudRunJobService.php
 import logging
 from typing import Dict, Any
 from google.cloud import run_v2
-from google.oauth2 import service_account
 from django.conf import settings
+from apps.dashboard.services._gcp_auth import load_credentials
 import os
 
 logger = logging.getLogger(__name__)
@@ -31,9 +31,7 @@ class CloudRunJobService:
                 logger.error(f"Credentials file not found: {self.credentials_path}")
                 return None
             
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path
-            )
+            credentials = load_credentials(self.credentials_path)
             
             client = run_v2.JobsClient(credentials=credentials)
             logger.info("Cloud Run Jobs client initialized successfully")
@@ -5,7 +5,7 @@ This is the impressive "full package" solution
 """
 import logging
 from typing import Dict, Any, Optional
-import json
+from pydantic_core import from_json
 
 logger = logging.getLogger(__name__)
 
@@ -164,7 +164,6 @@ class EnhancedContactService:
             # Parse JSON if it's a string
             if isinstance(ai_response, str):
                 try:
-                    import json
                     # Try to extract JSON from markdown code blocks if present
                     ai_response_clean = ai_response.strip()
                     if ai_response_clean.startswith('```json'):
@@ -180,9 +179,9 @@ class EnhancedContactService:
                         if start_idx != -1 and end_idx != -1:
                             ai_response_clean = ai_response_clean[start_idx:end_idx+1]
                     
-                    ai_response = json.loads(ai_response_clean)
+                    ai_response = from_json(ai_response_clean)
                     logger.info("Parsed AI response from JSON string")
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     logger.error(f"Failed to parse AI response as JSON: {str(e)}")
                     logger.error(f"AI response text: {ai_response[:500]}")  # Log first 500 chars
                     # Return empty contact structure
@@ -328,7 +327,7 @@ class EnhancedContactService:
         try:
             # Parse AI response if it's a string
             if isinstance(ai_response, str):
-                response_json = json.loads(ai_response)
+                response_json = from_json(ai_response)
             else:
                 response_json = ai_response
             
@@ -389,7 +388,7 @@ class EnhancedContactService:
             
             return response_json  # Return dict, not JSON string
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to parse AI response in _enhance_ai_response: {str(e)}")
             # Return empty contact structure as dict
             return {
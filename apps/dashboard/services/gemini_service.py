@@ -3,14 +3,24 @@ Gemini AI Service
 Handles interactions with Google's Gemini AI via Vertex AI
 For analytics chat and contact details extraction
 """
+import atexit
+import hashlib
+import itertools
+import json
 import logging
-from typing import List, Dict, Any, Optional
-from google.cloud import aiplatform
-from google.oauth2 import service_account
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
 from django.conf import settings
+from django.core.cache import cache
 import os
-import vertexai
-from vertexai.generative_models import GenerativeModel, ChatSession
+
+# The Vertex AI SDK is heavy to import; it is loaded on first use so Django
+# workers that never call Gemini don't pay for it at startup
+if TYPE_CHECKING:
+    from vertexai.generative_models import GenerativeModel
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +30,198 @@ def get_rag_service():
     return _get_rag()
 
 
+# Static sections of the contact extraction prompt, shared by the single and
+# batch prompt builders
+_CONTACT_EXTRACTION_RULES = """CRITICAL RULES - READ CAREFULLY:
+⛔ NEVER HALLUCINATE NAMES - This is the #1 most important rule
+⛔ NEVER make up or infer contact names, emails, or LinkedIn profiles
+⛔ NEVER use your training data or general knowledge about companies
+⛔ NEVER create fake names like "John Smith" or "Jane Doe"
+⛔ NEVER guess names based on job titles
+⛔ ONLY extract REAL names that appear explicitly in the provided data sources below
+- If NO REAL NAMES are found in the data, return empty decision_makers array []
+- Use null for ANY data not found in the provided sources
+- If you see "About Us" or "Team" page content, extract ONLY the real names shown there
+
+PRIORITY LOCATION INSTRUCTIONS:
+- This company operates in BENELUX (Belgium, Netherlands, Luxembourg)
+- PRIORITIZE finding contact information for the NETHERLANDS office/headquarters
+- If multiple locations exist, prefer Dutch office contacts over other regions
+- Look for addresses in Netherlands (postal codes like 1234 AB format)
+- Look for Dutch phone numbers (format: +31 or starting with 0)
+- The job postings we found are from NETHERLANDS, so focus on that office
+
+"""
+
+_CONTACT_EXTRACTION_INSTRUCTIONS = """EXTRACTION INSTRUCTIONS:
+1. Look ONLY in the data sources above for:
+   - REAL contact names (from "About", "Team", "Our Story", "Leadership" pages)
+   - Email addresses (from website scraping or job postings)
+   - Phone numbers (prioritize +31 numbers for Netherlands)
+   - Physical addresses (prioritize Netherlands addresses with Dutch postal codes)
+   - LinkedIn profile URLs (personal profiles like linkedin.com/in/name)
+   - LinkedIn company page URLs (like linkedin.com/company/name)
+   
+2. For finding REAL names and LinkedIn profiles on websites:
+   - Check "About Us" / "About" / "Over Ons" pages
+   - Check "Team" / "Our Team" / "Our Story" pages
+   - Check "Leadership" / "Management" pages
+   - Check "Contact" pages
+   - Extract names with their titles (e.g., "Matthijs Brouns - CTO")
+   - ONLY include names that are explicitly shown on these pages
+   - If a name has a LinkedIn link next to it, extract that LinkedIn URL
+   - LinkedIn URLs look like: linkedin.com/in/firstname-lastname or /company/companyname
+   
+3. If NO REAL NAMES found in the data:
+   - Return decision_makers: []
+   - Set general_contact fields to null
+   - In notes field, state: "No contact names found in provided data sources"
+   - NEVER fill in fake names
+
+4. If REAL NAMES found:
+   - Include ONLY names that were explicitly shown in About/Team pages
+   - Include their exact titles as shown on the website
+   - If a LinkedIn profile URL appears next to their name, include it in the linkedin_url field
+   - Mark confidence as "high" for directly extracted data from About pages
+   - Prioritize data/analytics decision-makers if found
+   - Include FULL physical address if found (street, postal code, city, country)
+
+5. ⛔ ABSOLUTE PROHIBITIONS:
+   - DO NOT make up names like "John Doe", "Jane Smith", etc.
+   - DO NOT infer names from job titles ("Head of Sales" ≠ create fake name)
+   - DO NOT use your training data or general knowledge
+   - DO NOT construct LinkedIn URLs unless they appear in the data
+   - DO NOT fill in "typical" or "likely" contact information
+   - DO NOT hallucinate - if uncertain, return empty array []
+
+"""
+
+# Single-company contact prompt: static preamble, then small templates for the
+# per-company parts (joined with _CONTACT_EXTRACTION_INSTRUCTIONS in between)
+_CONTACT_PROMPT_PREAMBLE = (
+    "You are a data extraction assistant that processes company information from provided sources.\n\n"
+    + _CONTACT_EXTRACTION_RULES
+)
+
+_CONTACT_PROMPT_COMPANY = """COMPANY INFORMATION:
+- Name: {company_name}
+- Type: {company_type}
+- Industry: {company_industry}
+- Company Size: {company_size}
+- Active Job Openings: {job_count}{linkedin_context}
+
+DATA SOURCES PROVIDED BELOW:
+{rag_context}
+
+"""
+
+_CONTACT_PROMPT_SCHEMA = """Return ONLY this JSON structure (no markdown, no explanations):
+{{
+  "company": {{
+    "name": "{company_name}",
+    "website": null,
+    "linkedin_company": null,
+    "headquarters": null,
+    "description": null
+  }},
+  "general_contact": {{
+    "email": null,
+    "phone": null,
+    "contact_form": null
+  }},
+  "decision_makers": [],
+  "social_media": {{
+    "twitter": null,
+    "facebook": null,
+    "youtube": null
+  }},
+  "notes": "No contact information found in provided data sources"
+}}
+
+Focus on C-level, VP/Director of Sales/Marketing/IT, and Business Development contacts. Return ONLY the JSON object, nothing else.
+"""
+
+# Output token budget for contact extraction. Gemini 2.5 Pro spends part of the
+# budget on thinking, so the base stays generous; each ~500 tokens of source
+# data adds room for roughly one more decision maker.
+CONTACT_BASE_OUTPUT_TOKENS = 4096
+CONTACT_MAX_OUTPUT_TOKENS = 8192
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap local token estimate (~4 characters per token), no API round-trip"""
+    return max(1, len(text) // 4)
+
+
+_CONTACT_PROMPT_STATIC_TOKENS = _estimate_tokens(
+    _CONTACT_PROMPT_PREAMBLE + _CONTACT_EXTRACTION_INSTRUCTIONS + _CONTACT_PROMPT_SCHEMA
+)
+
+# Gemini handles at most this many companies per batched extraction request
+MAX_CONTACT_BATCH_SIZE = 10
+
+# Analytics chat answers are cached for an hour, keyed on the normalized question
+ANALYTICS_CACHE_TTL = 3600
+_QUESTION_NOISE_RE = re.compile(r'[^\w\s]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Fallback chain for the newer Gemini models
+GEMINI_FALLBACK_MODELS = ["gemini-1.5-pro", "gemini-1.5-flash"]
+# Output token ceilings of the fallback models; larger max_output_tokens are rejected
+_MODEL_MAX_OUTPUT_TOKENS = {"gemini-1.5-pro": 8192, "gemini-1.5-flash": 8192}
+
+
+class _CircuitBreaker:
+    """
+    Per-model circuit breaker
+    
+    Opens after `threshold` consecutive failures; while open the model is
+    skipped for `cooldown` seconds, after which one trial call is let through.
+    Calls come from request threads and the shared executor, so state changes
+    are made under a lock.
+    """
+    
+    def __init__(self, threshold: int = 5, cooldown: float = 60):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def is_open(self) -> bool:
+        with self._lock:
+            if self.failures < self.threshold:
+                return False
+            now = time.monotonic()
+            if now - self.opened_at >= self.cooldown:
+                # Half-open: let this caller through as the trial call and restart the
+                # cooldown, so concurrent callers keep skipping the model meanwhile.
+                # A failed trial re-opens the circuit, a successful one resets it
+                self.opened_at = now
+                return False
+            return True
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+    
+    def reset(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = 0.0
+
+
 class GeminiService:
-    """Service for interacting with Gemini AI"""
+    """
+    Service for interacting with Gemini AI
+    
+    The singleton instance owns the GenerativeModel objects (and with them the
+    underlying Vertex AI gRPC channels), so connections stay open and are reused
+    across requests instead of paying a new TCP+TLS handshake per call.
+    """
     
     def __init__(self):
         self.project_id = settings.GOOGLE_CLOUD['PROJECT_ID']
@@ -29,6 +229,16 @@ class GeminiService:
         self.location = 'europe-west1'
         self.credentials_path = settings.GOOGLE_CLOUD['CREDENTIALS_PATH']
         
+        # GenerativeModel instances keyed by model name (reused across calls)
+        self._models: Dict[str, 'GenerativeModel'] = {}
+        
+        # Circuit breakers keyed by model name
+        self._breakers: Dict[str, _CircuitBreaker] = {}
+        
+        # Thread pool for I/O fan-out (RAG prefetch etc.), created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
         # Initialize Vertex AI
         self._initialize_vertex_ai()
     
@@ -39,9 +249,10 @@ class GeminiService:
                 logger.error(f"Credentials file not found: {self.credentials_path}")
                 return
             
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path
-            )
+            import vertexai
+            from apps.dashboard.services._gcp_auth import load_credentials
+            
+            credentials = load_credentials(self.credentials_path)
             
             vertexai.init(
                 project=self.project_id,
@@ -54,6 +265,47 @@ class GeminiService:
         except Exception as e:
             logger.error(f"Failed to initialize Vertex AI: {str(e)}")
     
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Long-lived thread pool shared by all I/O fan-out in this service"""
+        if self._executor is None:
+            # Locked so concurrent first callers can't each build (and leak) a pool
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=min(32, (os.cpu_count() or 4) * 4),
+                        thread_name_prefix="gemini-io"
+                    )
+                    atexit.register(self._executor.shutdown, wait=False)
+        return self._executor
+    
+    def _get_model(self, model_name: str) -> 'GenerativeModel':
+        """Get a cached GenerativeModel so its client connection is reused"""
+        model = self._models.get(model_name)
+        if model is None:
+            from vertexai.generative_models import GenerativeModel
+            model = GenerativeModel(model_name)
+            self._models[model_name] = model
+        return model
+    
+    def _candidate_models(self, model_name: str) -> List[str]:
+        """model_name followed by the fallback chain for the newer (2.x/3.x) models"""
+        # Try fallback: gemini-2.x -> gemini-1.5-pro -> gemini-1.5-flash
+        candidates = [model_name]
+        if "2." in model_name or "3" in model_name:
+            candidates += GEMINI_FALLBACK_MODELS
+        return candidates
+    
+    def _generation_config(self, model_name: str, temperature: float, max_tokens: int) -> Dict[str, Any]:
+        """Generation config for model_name, with max_tokens capped at the model's output limit"""
+        # Budgets sized for the primary model (e.g. batched contact extraction)
+        # would otherwise be rejected outright by a fallback
+        output_limit = _MODEL_MAX_OUTPUT_TOKENS.get(model_name)
+        return {
+            "temperature": temperature,
+            "max_output_tokens": min(max_tokens, output_limit) if output_limit else max_tokens,
+        }
+    
     def generate_content(
         self,
         prompt: str,
@@ -73,49 +325,103 @@ class GeminiService:
         Returns:
             Generated text response
         """
-        try:
-            model = GenerativeModel(model_name)
-            
-            generation_config = {
-                "temperature": temperature,
-                "max_output_tokens": max_tokens,
-            }
+        candidates = self._candidate_models(model_name)
+        
+        first_error = None
+        for candidate in candidates:
+            breaker = self._breakers.setdefault(candidate, _CircuitBreaker())
+            if breaker.is_open():
+                # Known-failing model: go straight to the next one instead of waiting on a timeout
+                logger.warning(f"Circuit open for {candidate}, skipping")
+                continue
             
-            response = model.generate_content(
-                prompt,
-                generation_config=generation_config
-            )
+            try:
+                model = self._get_model(candidate)
+                response = model.generate_content(
+                    prompt,
+                    generation_config=self._generation_config(candidate, temperature, max_tokens)
+                )
+                text = response.text
+                
+            except Exception as e:
+                breaker.record_failure()
+                logger.error(f"Gemini content generation failed with model {candidate}: {str(e)}")
+                first_error = first_error or e
+                continue
             
-            return response.text
+            breaker.reset()
+            if candidate != model_name:
+                logger.info(f"Fallback to {candidate} succeeded")
+            return text
+        
+        if first_error is not None:
+            logger.error(f"All Gemini models failed for {model_name}")
+            raise first_error
+        raise RuntimeError(f"All Gemini models are temporarily unavailable (circuit open): {', '.join(candidates)}")
+    
+    def generate_content_stream(
+        self,
+        prompt: str,
+        model_name: str = "gemini-1.5-pro",
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> Iterator[str]:
+        """
+        Generate content using Gemini, yielding text chunks as they are produced
+        
+        Use this for chat paths where time-to-first-token matters. Callers that
+        need the complete response (e.g. JSON parsing) should use generate_content.
+        
+        Args:
+            prompt: The prompt to send to Gemini
+            model_name: Model to use (gemini-1.5-pro, gemini-1.5-flash, etc.)
+            temperature: Creativity level (0-1)
+            max_tokens: Maximum tokens in response
+        
+        Yields:
+            Generated text chunks
+        
+        Models are tried in the same order, and with the same circuit breakers, as
+        generate_content. A model counts as working once its first chunk arrives;
+        errors after that are raised, since part of the answer was already yielded.
+        """
+        candidates = self._candidate_models(model_name)
+        
+        first_error = None
+        for candidate in candidates:
+            breaker = self._breakers.setdefault(candidate, _CircuitBreaker())
+            if breaker.is_open():
+                logger.warning(f"Circuit open for {candidate}, skipping")
+                continue
             
-        except Exception as e:
-            logger.error(f"Gemini content generation failed with model {model_name}: {str(e)}")
+            try:
+                model = self._get_model(candidate)
+                responses = iter(model.generate_content(
+                    prompt,
+                    generation_config=self._generation_config(candidate, temperature, max_tokens),
+                    stream=True
+                ))
+                first_chunks = list(itertools.islice(responses, 1))
+                
+            except Exception as e:
+                breaker.record_failure()
+                logger.error(f"Gemini streaming failed with model {candidate}: {str(e)}")
+                first_error = first_error or e
+                continue
             
-            # Try fallback: gemini-2.5-pro -> gemini-1.5-pro -> gemini-1.5-flash
-            if "2.5" in model_name or "3" in model_name:
-                logger.warning("Trying fallback to gemini-1.5-pro...")
-                try:
-                    model = GenerativeModel("gemini-1.5-pro")
-                    response = model.generate_content(
-                        prompt,
-                        generation_config=generation_config
-                    )
-                    logger.info("Fallback to gemini-1.5-pro succeeded")
-                    return response.text
-                except Exception as e2:
-                    logger.warning(f"gemini-1.5-pro also failed: {str(e2)}, trying gemini-1.5-flash...")
-                    try:
-                        model = GenerativeModel("gemini-1.5-flash")
-                        response = model.generate_content(
-                            prompt,
-                            generation_config=generation_config
-                        )
-                        logger.info("Fallback to gemini-1.5-flash succeeded")
-                        return response.text
-                    except Exception as e3:
-                        logger.error(f"All fallbacks failed: {str(e3)}")
+            breaker.reset()
+            if candidate != model_name:
+                logger.info(f"Fallback to {candidate} succeeded")
             
-            raise
+            for chunk in itertools.chain(first_chunks, responses):
+                if chunk.candidates and chunk.candidates[0].content.parts:
+                    yield chunk.text
+            return
+        
+        if first_error is not None:
+            logger.error(f"All Gemini models failed for {model_name}")
+            raise first_error
+        raise RuntimeError(f"All Gemini models are temporarily unavailable (circuit open): {', '.join(candidates)}")
     
     def chat(
         self,
@@ -135,7 +441,7 @@ class GeminiService:
             AI response
         """
         try:
-            model = GenerativeModel(model_name)
+            model = self._get_model(model_name)
             chat = model.start_chat()
             
             # Load chat history if provided
@@ -159,7 +465,8 @@ class GeminiService:
         self,
         company_data: Dict[str, Any],
         linkedin_job_url: Optional[str] = None,
-        additional_context: Optional[str] = None
+        additional_context: Optional[str] = None,
+        rag_context: Optional[str] = None
     ) -> str:
         """
         Get company contact details using Gemini with full company context
@@ -172,6 +479,7 @@ class GeminiService:
                 - company_size: str (e.g., '1000+')
                 - job_count: int
             linkedin_job_url: Optional LinkedIn job posting URL for context
+            rag_context: Job postings context that was already fetched (looked up when None)
         
         Returns:
             JSON formatted contact details
@@ -180,16 +488,25 @@ class GeminiService:
         if not isinstance(company_data, dict):
             raise ValueError(f"company_data must be a dict, got {type(company_data)}: {company_data}")
         
-        prompt = self._build_contact_details_prompt(company_data, linkedin_job_url, additional_context)
+        prompt = self._build_contact_details_prompt(company_data, linkedin_job_url, additional_context, rag_context)
+        
+        # Size the output budget from the amount of source data in the prompt
+        input_tokens = _estimate_tokens(prompt)
+        source_tokens = max(0, input_tokens - _CONTACT_PROMPT_STATIC_TOKENS)
+        max_tokens = min(
+            CONTACT_MAX_OUTPUT_TOKENS,
+            CONTACT_BASE_OUTPUT_TOKENS + 256 * (source_tokens // 500)
+        )
         
         try:
             # Use Gemini 2.5 Pro - GA release, most advanced reasoning model
-            logger.info(f"Using Gemini 2.5 Pro for contact extraction: {company_data.get('company_name', 'Unknown')}")
+            logger.info(f"Using Gemini 2.5 Pro for contact extraction: {company_data.get('company_name', 'Unknown')} "
+                        f"(~{input_tokens} prompt tokens, max_output_tokens={max_tokens})")
             response = self.generate_content(
                 prompt,
                 model_name="gemini-2.5-pro",
                 temperature=0.2,  # Very low temperature for factual accuracy
-                max_tokens=8192  # Increased to ensure complete JSON responses
+                max_tokens=max_tokens
             )
             
             logger.info(f"Gemini 2.5 Pro response received ({len(response)} characters)")
@@ -203,9 +520,15 @@ class GeminiService:
         self,
         company_data: Dict[str, Any],
         linkedin_job_url: Optional[str] = None,
-        additional_context: Optional[str] = None
+        additional_context: Optional[str] = None,
+        rag_context: Optional[str] = None
     ) -> str:
-        """Build engineered prompt for contact details extraction with RAG-enhanced context"""
+        """
+        Build engineered prompt for contact details extraction with RAG-enhanced context
+        
+        rag_context may carry job-postings context that was already fetched (see
+        _prefetch_rag_contexts); when None it is looked up here.
+        """
         
         company_name = company_data.get('company_name', 'Unknown Company')
         company_type = company_data.get('company_type', 'Not specified')
@@ -215,96 +538,159 @@ class GeminiService:
         
         linkedin_context = f"\n- LinkedIn Job Posting: {linkedin_job_url}" if linkedin_job_url else ""
         
+        rag_context = self._build_data_sources_context(company_name, additional_context, rag_context)
+        
+        fields = {
+            'company_name': company_name,
+            'company_type': company_type,
+            'company_industry': company_industry,
+            'company_size': company_size,
+            'job_count': job_count,
+            'linkedin_context': linkedin_context,
+            'rag_context': rag_context,
+        }
+        
+        prompt = "".join([
+            _CONTACT_PROMPT_PREAMBLE,
+            _CONTACT_PROMPT_COMPANY.format_map(fields),
+            _CONTACT_EXTRACTION_INSTRUCTIONS,
+            _CONTACT_PROMPT_SCHEMA.format_map(fields),
+        ])
+        
+        return prompt
+    
+    def _build_data_sources_context(
+        self,
+        company_name: str,
+        additional_context: Optional[str] = None,
+        job_postings_context: Optional[str] = None
+    ) -> str:
+        """Build the data sources block for a company (RAG context or research context)"""
         # Get RAG-enhanced context from job postings database (only if no additional context provided)
         rag_context = ""
         if not additional_context:
-            try:
-                rag_service = get_rag_service()
-                rag_data = rag_service.get_company_context(company_name)
-                if rag_data.get('context'):
-                    rag_context = f"\n\n{'='*60}\nDATA FROM JOB POSTINGS DATABASE:\n{'='*60}\n{rag_data['context']}\n{'='*60}\n"
-            except Exception as e:
-                logger.warning(f"Could not get RAG context: {str(e)}")
+            if job_postings_context is None:
+                job_postings_context = self._fetch_rag_context(company_name)
+            if job_postings_context:
+                rag_context = f"\n\n{'='*60}\nDATA FROM JOB POSTINGS DATABASE:\n{'='*60}\n{job_postings_context}\n{'='*60}\n"
         else:
             # Use the enhanced context from web browser service
             rag_context = f"\n\n{'='*60}\nDATA FROM RESEARCH:\n{'='*60}\n{additional_context}\n{'='*60}\n"
         
-        prompt = f"""You are a data extraction assistant that processes company information from provided sources.
-
-CRITICAL RULES - READ CAREFULLY:
-⛔ NEVER HALLUCINATE NAMES - This is the #1 most important rule
-⛔ NEVER make up or infer contact names, emails, or LinkedIn profiles
-⛔ NEVER use your training data or general knowledge about companies
-⛔ NEVER create fake names like "John Smith" or "Jane Doe"
-⛔ NEVER guess names based on job titles
-⛔ ONLY extract REAL names that appear explicitly in the provided data sources below
-- If NO REAL NAMES are found in the data, return empty decision_makers array []
-- Use null for ANY data not found in the provided sources
-- If you see "About Us" or "Team" page content, extract ONLY the real names shown there
-
-PRIORITY LOCATION INSTRUCTIONS:
-- This company operates in BENELUX (Belgium, Netherlands, Luxembourg)
-- PRIORITIZE finding contact information for the NETHERLANDS office/headquarters
-- If multiple locations exist, prefer Dutch office contacts over other regions
-- Look for addresses in Netherlands (postal codes like 1234 AB format)
-- Look for Dutch phone numbers (format: +31 or starting with 0)
-- The job postings we found are from NETHERLANDS, so focus on that office
-
-COMPANY INFORMATION:
+        return rag_context
+    
+    def _fetch_rag_context(self, company_name: str) -> str:
+        """Get the job postings context for a company from the RAG service"""
+        try:
+            rag_service = get_rag_service()
+            rag_data = rag_service.get_company_context(company_name)
+            return rag_data.get('context') or ""
+        except Exception as e:
+            logger.warning(f"Could not get RAG context: {str(e)}")
+            return ""
+    
+    def _prefetch_rag_contexts(self, company_names: List[str]) -> Dict[str, str]:
+        """
+        Fetch RAG contexts for several companies concurrently
+        
+        The lookups are I/O bound (BigQuery), so running them in parallel leaves
+        only CPU work for the prompt building that follows.
+        """
+        unique_names = list(dict.fromkeys(company_names))
+        contexts = self.executor.map(self._fetch_rag_context, unique_names)
+        return dict(zip(unique_names, contexts))
+    
+    def get_contact_details_batch(
+        self,
+        companies: List[Dict[str, Any]],
+        batch_size: int = MAX_CONTACT_BATCH_SIZE
+    ) -> List[Any]:
+        """
+        Get contact details for several companies, packing up to batch_size
+        companies into a single Gemini request
+        
+        Args:
+            companies: List of company information dicts (same keys as get_contact_details)
+            batch_size: Companies per request (capped at MAX_CONTACT_BATCH_SIZE)
+        
+        Returns:
+            One entry per company, in the same order as companies: the JSON formatted
+            contact details, or the exception raised for that company
+        """
+        for company_data in companies:
+            if not isinstance(company_data, dict):
+                raise ValueError(f"company_data must be a dict, got {type(company_data)}: {company_data}")
+        
+        batch_size = max(1, min(batch_size, MAX_CONTACT_BATCH_SIZE))
+        results = []
+        
+        rag_contexts = self._prefetch_rag_contexts(
+            [company_data.get('company_name', 'Unknown Company') for company_data in companies]
+        )
+        
+        for i in range(0, len(companies), batch_size):
+            chunk = companies[i:i + batch_size]
+            prompt = self._build_contact_details_batch_prompt(chunk, rag_contexts)
+            
+            try:
+                logger.info(f"Using Gemini 2.5 Pro for batched contact extraction ({len(chunk)} companies)")
+                response = self.generate_content(
+                    prompt,
+                    model_name="gemini-2.5-pro",
+                    temperature=0.2,
+                    max_tokens=CONTACT_BASE_OUTPUT_TOKENS * len(chunk)
+                )
+                results.extend(self._split_batch_response(response, len(chunk)))
+                
+            except Exception as e:
+                # Fall back to one request per company so a bad batch doesn't lose every result;
+                # the prefetched RAG contexts are reused rather than fetched again
+                logger.warning(f"Batched contact extraction failed, falling back to single requests: {str(e)}")
+                for company_data in chunk:
+                    try:
+                        results.append(self.get_contact_details(
+                            company_data,
+                            rag_context=rag_contexts.get(company_data.get('company_name', 'Unknown Company'))
+                        ))
+                    except Exception as company_error:
+                        # Already logged by get_contact_details; keep the other companies' results
+                        results.append(company_error)
+        
+        return results
+    
+    def _build_contact_details_batch_prompt(
+        self,
+        companies: List[Dict[str, Any]],
+        rag_contexts: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Build one prompt covering several companies; the static rules are sent only once"""
+        rag_contexts = rag_contexts or {}
+        company_blocks = []
+        for index, company_data in enumerate(companies, start=1):
+            company_name = company_data.get('company_name', 'Unknown Company')
+            company_blocks.append(f"""COMPANY {index}:
 - Name: {company_name}
-- Type: {company_type}
-- Industry: {company_industry}
-- Company Size: {company_size}
-- Active Job Openings: {job_count}{linkedin_context}
-
-DATA SOURCES PROVIDED BELOW:
-{rag_context}
-
-EXTRACTION INSTRUCTIONS:
-1. Look ONLY in the data sources above for:
-   - REAL contact names (from "About", "Team", "Our Story", "Leadership" pages)
-   - Email addresses (from website scraping or job postings)
-   - Phone numbers (prioritize +31 numbers for Netherlands)
-   - Physical addresses (prioritize Netherlands addresses with Dutch postal codes)
-   - LinkedIn profile URLs (personal profiles like linkedin.com/in/name)
-   - LinkedIn company page URLs (like linkedin.com/company/name)
-   
-2. For finding REAL names and LinkedIn profiles on websites:
-   - Check "About Us" / "About" / "Over Ons" pages
-   - Check "Team" / "Our Team" / "Our Story" pages
-   - Check "Leadership" / "Management" pages
-   - Check "Contact" pages
-   - Extract names with their titles (e.g., "Matthijs Brouns - CTO")
-   - ONLY include names that are explicitly shown on these pages
-   - If a name has a LinkedIn link next to it, extract that LinkedIn URL
-   - LinkedIn URLs look like: linkedin.com/in/firstname-lastname or /company/companyname
-   
-3. If NO REAL NAMES found in the data:
-   - Return decision_makers: []
-   - Set general_contact fields to null
-   - In notes field, state: "No contact names found in provided data sources"
-   - NEVER fill in fake names
+- Type: {company_data.get('company_type', 'Not specified')}
+- Industry: {company_data.get('company_industry', 'Not specified')}
+- Company Size: {company_data.get('company_size', 'Not specified')}
+- Active Job Openings: {company_data.get('job_count', 0)}
 
-4. If REAL NAMES found:
-   - Include ONLY names that were explicitly shown in About/Team pages
-   - Include their exact titles as shown on the website
-   - If a LinkedIn profile URL appears next to their name, include it in the linkedin_url field
-   - Mark confidence as "high" for directly extracted data from About pages
-   - Prioritize data/analytics decision-makers if found
-   - Include FULL physical address if found (street, postal code, city, country)
-
-5. ⛔ ABSOLUTE PROHIBITIONS:
-   - DO NOT make up names like "John Doe", "Jane Smith", etc.
-   - DO NOT infer names from job titles ("Head of Sales" ≠ create fake name)
-   - DO NOT use your training data or general knowledge
-   - DO NOT construct LinkedIn URLs unless they appear in the data
-   - DO NOT fill in "typical" or "likely" contact information
-   - DO NOT hallucinate - if uncertain, return empty array []
+DATA SOURCES FOR COMPANY {index}:
+{self._build_data_sources_context(company_name, job_postings_context=rag_contexts.get(company_name))}
+""")
+        
+        companies_section = "\n".join(company_blocks)
+        
+        return f"""You are a data extraction assistant that processes company information from provided sources.
+Each company below must be handled independently, using ONLY the data sources listed for that company.
 
-Return ONLY this JSON structure (no markdown, no explanations):
+{_CONTACT_EXTRACTION_RULES}COMPANIES:
+{companies_section}
+{_CONTACT_EXTRACTION_INSTRUCTIONS}Return a JSON array with one object per company in the same order ({len(companies)} objects).
+Each object must use this structure (no markdown, no explanations):
 {{
   "company": {{
-    "name": "{company_name}",
+    "name": "<company name>",
     "website": null,
     "linkedin_company": null,
     "headquarters": null,
@@ -324,10 +710,21 @@ Return ONLY this JSON structure (no markdown, no explanations):
   "notes": "No contact information found in provided data sources"
 }}
 
-Focus on C-level, VP/Director of Sales/Marketing/IT, and Business Development contacts. Return ONLY the JSON object, nothing else.
+Focus on C-level, VP/Director of Sales/Marketing/IT, and Business Development contacts. Return ONLY the JSON array, nothing else.
 """
+    
+    def _split_batch_response(self, response: str, expected: int) -> List[str]:
+        """Split a batched JSON array response into one JSON string per company"""
+        text = response.strip()
+        if text.startswith('```'):
+            text = text.split('\n', 1)[1] if '\n' in text else ''
+            text = text.rsplit('```', 1)[0]
         
-        return prompt
+        items = json.loads(text)
+        if not isinstance(items, list) or len(items) != expected:
+            raise ValueError(f"Expected a JSON array of {expected} objects")
+        
+        return [json.dumps(item, indent=2) for item in items]
     
     def analyze_data(
         self,
@@ -382,6 +779,80 @@ Provide a clear, professional answer based on the data. Include insights and tre
         Returns:
             AI-generated response
         """
+        cache_key = self._analytics_cache_key(user_message, context_data)
+        cached_response = cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Analytics chat cache hit")
+            return cached_response
+        
+        prompt = self._build_analytics_prompt(user_message, context_data)
+        
+        try:
+            response = self.generate_content(
+                prompt,
+                model_name="gemini-2.0-flash-exp",  # Fast model for chat
+                temperature=0.7,
+                max_tokens=512
+            )
+            
+            cache.set(cache_key, response, ANALYTICS_CACHE_TTL)
+            logger.info("Analytics chat cache miss")
+            return response
+            
+        except Exception as e:
+            logger.error(f"Analytics chat generation failed: {str(e)}")
+            return "I apologize, but I'm having trouble processing your request right now. Please try again in a moment."
+
+    def generate_analytics_response_stream(
+        self,
+        user_message: str,
+        context_data: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Stream an analytics chat response from Gemini as it is generated
+        
+        Args:
+            user_message: User's question or message
+            context_data: Dictionary with job market statistics
+        
+        Yields:
+            Text chunks of the AI-generated response
+        """
+        cache_key = self._analytics_cache_key(user_message, context_data)
+        cached_response = cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Analytics chat cache hit")
+            yield cached_response
+            return
+        
+        prompt = self._build_analytics_prompt(user_message, context_data)
+        
+        chunks = []
+        try:
+            for text in self.generate_content_stream(
+                prompt,
+                model_name="gemini-2.0-flash-exp",  # Fast model for chat
+                temperature=0.7,
+                max_tokens=512
+            ):
+                chunks.append(text)
+                yield text
+            
+        except Exception as e:
+            logger.error(f"Analytics chat streaming failed: {str(e)}")
+            if not chunks:
+                yield "I apologize, but I'm having trouble processing your request right now. Please try again in a moment."
+            return
+        
+        cache.set(cache_key, "".join(chunks), ANALYTICS_CACHE_TTL)
+        logger.info("Analytics chat cache miss")
+    
+    def _build_analytics_prompt(
+        self,
+        user_message: str,
+        context_data: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the analytics chat prompt"""
         # Build context from data
         context = ""
         if context_data:
@@ -409,20 +880,24 @@ If the question is outside your scope, politely guide the user to relevant topic
 Keep responses concise (2-3 paragraphs maximum) and friendly.
 """
         
-        try:
-            response = self.generate_content(
-                prompt,
-                model_name="gemini-2.0-flash-exp",  # Fast model for chat
-                temperature=0.7,
-                max_tokens=512
-            )
-            
-            return response
-            
-        except Exception as e:
-            logger.error(f"Analytics chat generation failed: {str(e)}")
-            return "I apologize, but I'm having trouble processing your request right now. Please try again in a moment."
-
+        return prompt
+    
+    def _analytics_cache_key(
+        self,
+        user_message: str,
+        context_data: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build the cache key for an analytics question
+        
+        Case, punctuation and whitespace are normalized away so near-identical
+        dashboard questions ("Top industries?" / "top industries") share an entry.
+        """
+        normalized = _QUESTION_NOISE_RE.sub(' ', user_message.lower())
+        normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+        context = json.dumps(context_data or {}, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{normalized}|{context}".encode('utf-8')).hexdigest()
+        return f'gemini:analytics:{digest}'
 
 
 # Singleton instance
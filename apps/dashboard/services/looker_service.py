@@ -3,19 +3,74 @@ Looker Embed Service
 Generates signed SSO embed URLs for Looker dashboards
 Ported from Laravel LookerEmbedService.php
 """
+import os
 import time
+import threading
 import hashlib
 import hmac
 import base64
-import secrets
 import json
 from urllib.parse import urlencode, quote
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Embed user permissions when the caller doesn't pass any
+DEFAULT_PERMISSIONS = [
+    'access_data',
+    'see_looks',
+    'see_user_dashboards',
+    'explore',
+    'create_table_calculations',
+    'download_with_limit',
+    'download_without_limit',
+    'see_drill_overlay',
+    'save_content',
+    'embed_browse_spaces',
+    'schedule_look_emails',
+    'schedule_external_look_emails',
+    'send_outgoing_webhook',
+    'send_to_s3',
+    'send_to_sftp'
+]
+
+EMBED_MODELS = ['zoektrends']  # Your Looker model name
+EMBED_SESSION_LENGTH = 3600  # 1 hour session
+
+# Max number of (dashboard, filters, permissions) combinations kept in memory
+URL_PARTS_CACHE_SIZE = 256
+
+
+class _NoncePool:
+    """
+    Hands out random nonces from a buffer filled by a single os.urandom call
+    
+    Same entropy source as secrets.token_hex, but one syscall per 4 KB instead
+    of one per nonce. Each byte is handed out once.
+    """
+    
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._buf = os.urandom(size)
+        self._pos = 0
+        self._lock = threading.Lock()
+    
+    def take(self, n: int = 16) -> str:
+        """Return n random bytes as a hex string"""
+        with self._lock:
+            if self._pos + n > len(self._buf):
+                self._buf = os.urandom(max(self._size, n))
+                self._pos = 0
+            chunk = self._buf[self._pos:self._pos + n]
+            self._pos += n
+        return chunk.hex()
+
+
+_nonce_pool = _NoncePool()
+
 
 class LookerEmbedService:
     """Service for generating Looker embed URLs with SSO"""
@@ -24,6 +79,106 @@ class LookerEmbedService:
         self.looker_host = settings.LOOKER['HOST']
         self.embed_secret = settings.LOOKER['EMBED_SECRET']
         self.embed_user = settings.LOOKER['EMBED_USER']
+        
+        # URL parameter values that never change between requests
+        self._const_json = {
+            'permissions': json.dumps(DEFAULT_PERMISSIONS),
+            'models': json.dumps(EMBED_MODELS),
+            'group_ids': '[]',
+            'access_filters': '{}',
+            'user_attributes': '{}',
+        }
+        
+        # HMAC primed with the embed secret; copied per URL to skip re-keying
+        self._secret_bytes = self.embed_secret.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, b'', hashlib.sha256)
+        
+        # Signed embed user JSON for the default permissions
+        self._default_embed_user_json = self._build_embed_user_json(DEFAULT_PERMISSIONS)
+        
+        # Deterministic URL parts per (dashboard, filters, permissions), LRU ordered
+        # Guarded by _url_parts_lock: the singleton is shared by request threads and
+        # even cache hits reorder the dict
+        self._url_parts_cache: OrderedDict = OrderedDict()
+        self._url_parts_lock = threading.Lock()
+    
+    def _build_embed_user_json(self, permissions: List[str]) -> str:
+        """Serialize the embed user details in the canonical form used for signing"""
+        embed_user_data = {
+            'external_user_id': self.embed_user,
+            'first_name': 'ZoekTrends',
+            'last_name': 'User',
+            'session_length': EMBED_SESSION_LENGTH,
+            'force_logout_login': True,
+            'permissions': permissions,
+            'models': EMBED_MODELS,
+            'group_ids': [],
+            'external_group_id': 'zoektrends_users',
+            'user_attributes': {},
+            'access_filters': {}
+        }
+        return json.dumps(embed_user_data, separators=(',', ':'))
+    
+    def _get_url_parts(
+        self,
+        dashboard_id: str,
+        filters: Optional[Dict[str, str]] = None,
+        permissions: Optional[List[str]] = None
+    ) -> Tuple[str, str, bytes, bytes]:
+        """
+        Get the embed path, permissions JSON and the fixed parts of the signing input
+        
+        The signing input is host, path, nonce, timestamp, session id and embed
+        user JSON joined by newlines; everything around nonce/timestamp only
+        depends on the arguments and is returned pre-encoded as (prefix, suffix).
+        These parts are memoized. The nonce, timestamp and signature are not:
+        Looker rejects a reused nonce, so every URL must still be signed fresh.
+        """
+        key = (
+            dashboard_id,
+            tuple(filters.items()) if filters else (),
+            tuple(permissions) if permissions else ()
+        )
+        with self._url_parts_lock:
+            parts = self._url_parts_cache.get(key)
+            if parts is not None:
+                self._url_parts_cache.move_to_end(key)
+                return parts
+        
+        # Build the embed path
+        embed_path = f"/login/embed/{quote(f'/embed/dashboards/{dashboard_id}')}"
+        
+        # Add filters if provided
+        if filters:
+            embed_path += '?' + urlencode(filters, safe='/', quote_via=quote)
+        
+        # Embed user details (pre-serialized for the default permissions)
+        if permissions:
+            embed_user_json = self._build_embed_user_json(permissions)
+            permissions_json = json.dumps(permissions)
+        else:
+            embed_user_json = self._default_embed_user_json
+            permissions_json = self._const_json['permissions']
+        
+        # Note: Using empty session_id as we're not using PHP sessions
+        session_id = b''
+        sign_prefix = b'\n'.join([
+            self.looker_host.encode('utf-8'),
+            embed_path.encode('utf-8'),
+            b''
+        ])
+        sign_suffix = b'\n'.join([
+            b'',
+            session_id,
+            embed_user_json.encode('utf-8')
+        ])
+        
+        parts = (embed_path, permissions_json, sign_prefix, sign_suffix)
+        with self._url_parts_lock:
+            self._url_parts_cache[key] = parts
+            if len(self._url_parts_cache) > URL_PARTS_CACHE_SIZE:
+                self._url_parts_cache.popitem(last=False)
+        return parts
     
     def generate_dashboard_embed_url(
         self,
@@ -43,98 +198,44 @@ class LookerEmbedService:
             Signed embed URL
         """
         try:
-            # Build the embed path
-            embed_path = f"/login/embed/{quote(f'/embed/dashboards/{dashboard_id}')}"
+            embed_path, permissions_json, sign_prefix, sign_suffix = self._get_url_parts(
+                dashboard_id, filters, permissions
+            )
             
             # Generate nonce (random string to prevent replay attacks)
-            nonce = secrets.token_hex(16)
+            nonce = _nonce_pool.take(16)
             
             # Current timestamp
             timestamp = str(int(time.time()))
             
-            # Build embed user details
-            embed_user_data = {
-                'external_user_id': self.embed_user,
-                'first_name': 'ZoekTrends',
-                'last_name': 'User',
-                'session_length': 3600,  # 1 hour session
-                'force_logout_login': True,
-                'permissions': permissions or [
-                    'access_data',
-                    'see_looks',
-                    'see_user_dashboards',
-                    'explore',
-                    'create_table_calculations',
-                    'download_with_limit',
-                    'download_without_limit',
-                    'see_drill_overlay',
-                    'save_content',
-                    'embed_browse_spaces',
-                    'schedule_look_emails',
-                    'schedule_external_look_emails',
-                    'send_outgoing_webhook',
-                    'send_to_s3',
-                    'send_to_sftp'
-                ],
-                'models': ['zoektrends'],  # Your Looker model name
-                'group_ids': [],
-                'external_group_id': 'zoektrends_users',
-                'user_attributes': {},
-                'access_filters': {}
-            }
-            
-            # Add filters if provided
-            if filters:
-                filter_params = []
-                for field, value in filters.items():
-                    filter_params.append(f"{quote(field)}={quote(value)}")
-                embed_path += '?' + '&'.join(filter_params)
-            
-            # Create the string to sign
-            # Note: Using empty session_id as we're not using PHP sessions
-            session_id = ''
-            string_to_sign = "\n".join([
-                self.looker_host,
-                embed_path,
-                nonce,
-                timestamp,
-                session_id,
-                json.dumps(embed_user_data, separators=(',', ':'))
-            ])
-            
-            # Generate signature using HMAC SHA256
-            signature = base64.b64encode(
-                hmac.new(
-                    self.embed_secret.encode('utf-8'),
-                    string_to_sign.encode('utf-8'),
-                    hashlib.sha256
-                ).digest()
-            ).decode('utf-8')
+            # Sign host/path/nonce/timestamp/session_id/embed user JSON (newline separated)
+            signer = self._hmac_template.copy()
+            signer.update(sign_prefix)
+            signer.update(b'\n'.join([nonce.encode('ascii'), timestamp.encode('ascii')]))
+            signer.update(sign_suffix)
+            signature = base64.b64encode(signer.digest()).decode('ascii')
             
             # Build the final URL with all parameters
             params = {
                 'nonce': nonce,
                 'time': timestamp,
-                'session_length': embed_user_data['session_length'],
-                'external_user_id': embed_user_data['external_user_id'],
-                'permissions': json.dumps(embed_user_data['permissions']),
-                'models': json.dumps(embed_user_data['models']),
-                'access_filters': json.dumps(embed_user_data['access_filters']),
-                'first_name': embed_user_data['first_name'],
-                'last_name': embed_user_data['last_name'],
-                'group_ids': json.dumps(embed_user_data['group_ids']),
-                'external_group_id': embed_user_data['external_group_id'],
-                'user_attributes': json.dumps(embed_user_data['user_attributes']),
-                'force_logout_login': 'true' if embed_user_data['force_logout_login'] else 'false',
+                'session_length': EMBED_SESSION_LENGTH,
+                'external_user_id': self.embed_user,
+                'permissions': permissions_json,
+                'models': self._const_json['models'],
+                'access_filters': self._const_json['access_filters'],
+                'first_name': 'ZoekTrends',
+                'last_name': 'User',
+                'group_ids': self._const_json['group_ids'],
+                'external_group_id': 'zoektrends_users',
+                'user_attributes': self._const_json['user_attributes'],
+                'force_logout_login': 'true',
                 'signature': signature
             }
             
             # Build final URL
-            embed_url = f"https://{self.looker_host}{embed_path}"
-            if '?' in embed_url:
-                embed_url += '&' + urlencode(params)
-            else:
-                embed_url += '?' + urlencode(params)
+            separator = '&' if filters else '?'
+            embed_url = f"https://{self.looker_host}{embed_path}{separator}{urlencode(params)}"
             
             logger.info(f"Generated Looker embed URL for dashboard: {dashboard_id}")
             return embed_url
@@ -2,10 +2,20 @@
 OpenAI Service for Contact Details Extraction
 Uses GPT-4o with structured prompting for high-quality business research
 """
+import asyncio
+import functools
+import hashlib
+import io
 import logging
-from typing import Dict, Any, Optional
-from openai import OpenAI
+import re
+import time
+from collections import deque
+from typing import Dict, Any, List, Literal, Optional
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +24,227 @@ def get_rag_service():
     from apps.dashboard.services.contact_rag_service import get_rag_service as _get_rag
     return _get_rag()
 
+# Model tiers for contact extraction: the cheap model first, escalating to the
+# next tier only when its answer fails validation or is mostly guesswork
+CONTACT_MODELS = ("gpt-4o-mini", "gpt-4o")
+MAX_LOW_CONFIDENCE_CONTACTS = 2
+
+# Header fields of _build_user_prompt that change between refreshes without
+# changing the answer (the job count); blanked out before cache keying. Only
+# the first match (the header) is stripped: dates and counts in the data
+# sources below it are real differences and must keep distinct keys.
+_VOLATILE_PROMPT_RE = re.compile(r'^- Active Job Openings: .*$', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class _StrictModel(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+
+class Company(_StrictModel):
+    name: str
+    website: Optional[str]
+    linkedin_company: Optional[str]
+    headquarters: Optional[str]
+    description: Optional[str]
+
+
+class GeneralContact(_StrictModel):
+    email: Optional[str]
+    phone: Optional[str]
+    contact_form: Optional[str]
+
+
+class DecisionMaker(_StrictModel):
+    name: str
+    title: Optional[str]
+    department: Optional[str]
+    linkedin_url: Optional[str]
+    email: Optional[str]
+    confidence: Literal['high', 'medium', 'low']
+
+
+class SocialMedia(_StrictModel):
+    twitter: Optional[str]
+    facebook: Optional[str]
+    youtube: Optional[str]
+
+
+class ContactDetailsSchema(_StrictModel):
+    """Contact-details JSON returned by GPT-4o (enforced at decode time)"""
+    company: Company
+    general_contact: GeneralContact
+    decision_makers: List[DecisionMaker]
+    social_media: SocialMedia
+    notes: Optional[str]
+
+
+class ContactDetailsBatchSchema(_StrictModel):
+    """Batched contact-details JSON: one result per company, in request order"""
+    results: List[ContactDetailsSchema]
+
+
+# Structured output: the decoder can only emit JSON matching the schema, so
+# there is no markdown/prose to strip and no malformed responses to retry
+CONTACT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "contact_details",
+        "strict": True,
+        "schema": ContactDetailsSchema.model_json_schema()
+    }
+}
+
+CONTACT_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "contact_details_batch",
+        "strict": True,
+        "schema": ContactDetailsBatchSchema.model_json_schema()
+    }
+}
+
+# Companies packed into one batched request
+MAX_CONTACT_BATCH_SIZE = 8
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(schema: type) -> TypeAdapter:
+    """Build the (relatively expensive) validator for a schema once and reuse it"""
+    return TypeAdapter(schema)
+
+
+# System prompt, kept byte-identical across calls and free of per-company data
+# so OpenAI's automatic prompt caching can reuse it as a shared prefix (it
+# only applies once the prefix reaches 1024 tokens, hence the static
+# extraction instructions live here rather than in the user prompt)
+_SYSTEM_PROMPT = """You are a data extraction assistant that processes company information from provided sources.
+
+CRITICAL RULES - READ CAREFULLY:
+🚫 NEVER use your training data or general knowledge about companies
+🚫 NEVER make up or infer contact names, emails, or LinkedIn profiles
+🚫 NEVER hallucinate information not explicitly provided in the context
+✅ ONLY extract information that appears in the provided data sources
+✅ Use null for ANY data not found in the provided sources
+✅ If no contacts are found in the data, return empty decision_makers array
+
+YOUR CAPABILITIES:
+- Extract contact information from provided website data and job postings
+- Parse email addresses, phone numbers, and names from HTML/text content
+- Identify LinkedIn URLs that appear in the source data
+- Organize found information into structured JSON format
+
+WHAT YOU CANNOT DO:
+- Look up or recall information about companies from your training
+- Guess or infer people's names based on typical company structures
+- Construct LinkedIn URLs unless they appear in the provided data
+- Make assumptions about who works at the company
+
+EXTRACTION RULES:
+⚠️ Use null for ANY field where data is not found in provided sources
+⚠️ Empty decision_makers array [] if NO contacts found in data
+⚠️ Only include LinkedIn URLs if they EXPLICITLY appear in the provided data
+⚠️ Only include emails/phones that were FOUND in web scraping results
+⚠️ Mark confidence as "low" for any inferred data, "high" only for explicitly found data
+
+DATA SOURCE PRIORITY:
+1. Website scraping results (emails, phones, contact pages found by web browser)
+2. Job posting descriptions and contact information
+3. If NEITHER source has contact info → return null/empty arrays
+
+FORBIDDEN ACTIONS:
+❌ Do NOT use company name to guess executive names
+❌ Do NOT construct LinkedIn URLs from assumed name patterns
+❌ Do NOT fill in "typical" contact information
+❌ Do NOT use your knowledge of real people at real companies
+❌ Do NOT provide placeholder or example data
+
+REQUIRED BEHAVIOR:
+✅ If web scraping found 0 emails → general_contact.email = null
+✅ If no names found in data → decision_makers = []
+✅ Be honest in notes field: "No contacts found in provided data sources"
+
+PER-COMPANY EXTRACTION INSTRUCTIONS:
+1. Look ONLY in the provided data sources for:
+   - Email addresses (from website scraping or job postings)
+   - Phone numbers (from website scraping)
+   - Contact names (from website scraping or job postings)
+   - LinkedIn URLs (ONLY if they appear in the provided data)
+   
+2. If NO contacts found in the data:
+   - Return decision_makers: []
+   - Set general_contact fields to null
+   - In notes field, state: "No contact information found in provided data sources"
+
+3. If SOME contacts found:
+   - Only include what was explicitly found in the data
+   - Mark confidence as "high" for directly extracted data
+   - Prioritize data/analytics decision-makers if found in job postings
+
+4. DO NOT:
+   - Look up or recall information about this company from your training data
+   - Make up or infer names, emails, or LinkedIn profiles
+   - Construct LinkedIn URLs based on name patterns
+   - Fill in "typical" or "likely" contact information
+"""
+
+# GPT-4o context window and output budget for a contact-details response
+CONTACT_CONTEXT_TOKENS = 128_000
+CONTACT_MAX_OUTPUT_TOKENS = 1024  # A contact JSON is typically 400-800 tokens
+CONTACT_MIN_OUTPUT_TOKENS = 512
+CONTACT_TOKEN_MARGIN = 256
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap local token estimate (~4 characters per token), no tokenizer needed"""
+    return max(1, len(text) // 4)
+
+
+# The system prompt never changes, so count it once
+_SYSTEM_PROMPT_TOKENS = _estimate_tokens(_SYSTEM_PROMPT)
+
+
+class _TokenRateLimiter:
+    """
+    Async tokens-per-minute limiter fed with response.usage.total_tokens
+    
+    Waits before a request while the tokens spent in the last 60 seconds are
+    at or above the limit. A limit of 0 disables throttling.
+    """
+    
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._spent = deque()  # (timestamp, tokens)
+    
+    def _spent_last_minute(self) -> int:
+        cutoff = time.monotonic() - 60
+        while self._spent and self._spent[0][0] < cutoff:
+            self._spent.popleft()
+        return sum(tokens for _, tokens in self._spent)
+    
+    async def wait(self):
+        if not self.tokens_per_minute:
+            return
+        while self._spent_last_minute() >= self.tokens_per_minute:
+            await asyncio.sleep(self._spent[0][0] + 60 - time.monotonic())
+    
+    def record(self, tokens: int):
+        if self.tokens_per_minute:
+            self._spent.append((time.monotonic(), tokens))
+
+
+async def _close_at_loop_shutdown(client: AsyncOpenAI):
+    """
+    Close client (and its connection pool) when its event loop shuts down
+    
+    Runs as a background task that only wakes up when asyncio.run() cancels the
+    remaining tasks on exit, which happens while the loop can still run the close.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.close()
+
 
 class OpenAIService:
     """Service for OpenAI API interactions - focused on contact research"""
@@ -29,7 +260,26 @@ class OpenAIService:
                 "Please set OPENAI_API_KEY in your .env file or settings.py"
             )
         
+        self.api_key = api_key
         self.client = OpenAI(api_key=api_key)
+        
+        # Async client, concurrency semaphore and rate limiter for bulk enrichment.
+        # They are tied to an event loop, so they are (re)created per running loop.
+        self.max_concurrency = int(getattr(settings, 'OPENAI_MAX_CONCURRENCY', 16) or 16)
+        self.tokens_per_minute = int(getattr(settings, 'OPENAI_TPM_LIMIT', 0) or 0)
+        # Contact responses are deterministic (temperature 0), so identical prompts are cached
+        self.cache_ttl = int(getattr(settings, 'OPENAI_CACHE_TTL', 86400) or 86400)
+        self.http_pool_size = max(
+            int(getattr(settings, 'OPENAI_HTTP_POOL_SIZE', 64) or 64),
+            self.max_concurrency
+        )
+        self._async_loop = None
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_closer: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limiter: Optional[_TokenRateLimiter] = None
+        self.models = CONTACT_MODELS
+        
         logger.info("OpenAI client initialized successfully")
     
     def get_contact_details(
@@ -39,7 +289,7 @@ class OpenAIService:
         additional_context: Optional[str] = None
     ) -> str:
         """
-        Get contact details for a company using GPT-4o
+        Get contact details for a company using GPT-4o-mini, escalating to GPT-4o when needed
         
         Args:
             company_data: Dict with company_name, company_type, company_industry, company_size, job_count
@@ -57,119 +307,351 @@ class OpenAIService:
         try:
             prompt = self._build_contact_details_prompt(company_data, linkedin_job_url, additional_context)
             
-            # Use GPT-4o with structured system prompt
-            response = self.client.chat.completions.create(
-                model="gpt-4o",  # Latest and best model
+            cache_key = self._response_cache_key(company_name, prompt)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"OpenAI contact details cache hit for {company_name}")
+                return cached
+            
+            for model in self.models:
+                result = self._stream_contact_details(model, prompt)
+                reason = self._escalation_reason(result)
+                if reason is None or model == self.models[-1]:
+                    break
+                logger.info(f"Escalating contact details for {company_name} from {model}: {reason}")
+            
+            if not self._validate(result):
+                cache.set(cache_key, result, self.cache_ttl)
+            
+            logger.info(f"OpenAI contact details retrieved for {company_name} ({model})")
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to get contact details for {company_name}: {str(e)}")
+            raise
+    
+    def _stream_contact_details(self, model: str, prompt: str) -> str:
+        """Run one contact-details completion, streamed so generation overlaps with reading it"""
+        stream = self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": _SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.0,  # Low temperature for factual, consistent responses
+            max_tokens=self._max_output_tokens(prompt),
+            response_format=CONTACT_RESPONSE_FORMAT,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        buffer = io.StringIO()
+        usage = None
+        for chunk in stream:
+            if chunk.choices:
+                buffer.write(chunk.choices[0].delta.content or "")
+            if chunk.usage:
+                usage = chunk.usage
+        
+        if usage:
+            logger.debug(f"{model} tokens used: {usage.total_tokens} (prompt: {usage.prompt_tokens}, completion: {usage.completion_tokens})")
+        
+        return buffer.getvalue()
+    
+    def get_contact_details_batch(
+        self,
+        companies: List[Dict[str, Any]],
+        batch_size: int = MAX_CONTACT_BATCH_SIZE
+    ) -> List[Any]:
+        """
+        Get contact details for several companies, packing up to batch_size
+        uncached companies into a single GPT-4o request
+        
+        Args:
+            companies: List of company information dicts (same keys as get_contact_details)
+            batch_size: Companies per request (capped at MAX_CONTACT_BATCH_SIZE)
+        
+        Returns:
+            One entry per company, in the same order as companies: the JSON string
+            with contact details, or the exception raised for that company
+            (as get_contact_details_many does)
+        """
+        for company_data in companies:
+            if not isinstance(company_data, dict):
+                raise ValueError(f"company_data must be a dict, got {type(company_data)}: {company_data}")
+        
+        batch_size = max(1, min(batch_size, MAX_CONTACT_BATCH_SIZE))
+        results: List[Any] = [None] * len(companies)
+        pending = []  # (index, prompt, cache_key) for companies not in the cache
+        
+        for index, company_data in enumerate(companies):
+            company_name = company_data.get('company_name', 'Unknown Company')
+            prompt = self._build_contact_details_prompt(company_data)
+            cache_key = self._response_cache_key(company_name, prompt)
+            results[index] = cache.get(cache_key)
+            if results[index] is None:
+                pending.append((index, prompt, cache_key))
+        
+        for i in range(0, len(pending), batch_size):
+            chunk = pending[i:i + batch_size]
+            try:
+                logger.info(f"Using {self.models[0]} for batched contact extraction ({len(chunk)} companies)")
+                chunk_results = self._request_contact_details_batch(
+                    [prompt for _, prompt, _ in chunk], self.models[0]
+                )
+                
+                # Re-run only the companies whose answers need the stronger model
+                escalate = [j for j, result in enumerate(chunk_results) if self._escalation_reason(result)]
+                if escalate and len(self.models) > 1:
+                    logger.info(f"Escalating {len(escalate)}/{len(chunk)} batched companies to {self.models[-1]}")
+                    for j, result in zip(escalate, self._request_contact_details_batch(
+                        [chunk[j][1] for j in escalate], self.models[-1]
+                    )):
+                        chunk_results[j] = result
+                
+                for (index, _, cache_key), result in zip(chunk, chunk_results):
+                    results[index] = result
+                    cache.set(cache_key, result, self.cache_ttl)
+                
+            except Exception as e:
+                # Fall back to one request per company so a bad batch doesn't lose every result
+                logger.warning(f"Batched contact extraction failed, falling back to single requests: {str(e)}")
+                for index, _, _ in chunk:
+                    try:
+                        results[index] = self.get_contact_details(companies[index])
+                    except Exception as company_error:
+                        # Already logged by get_contact_details; keep the other companies' results
+                        results[index] = company_error
+        
+        return results
+    
+    def _request_contact_details_batch(self, prompts: List[str], model: str) -> List[str]:
+        """Send several per-company prompts as one request and split the results"""
+        batch_prompt = (
+            f"Extract contact details for each of the {len(prompts)} companies below. "
+            "Handle each company independently, using ONLY the data sources listed for that company.\n"
+            f"Return one entry in results per company, in the same order ({len(prompts)} entries).\n\n"
+            + "\n\n".join(
+                f"{'#' * 60}\nCOMPANY {index}\n{'#' * 60}\n{prompt}"
+                for index, prompt in enumerate(prompts, start=1)
+            )
+        )
+        
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": _SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": batch_prompt
+                }
+            ],
+            temperature=0.0,
+            max_tokens=min(
+                CONTACT_MAX_OUTPUT_TOKENS * len(prompts),
+                CONTACT_CONTEXT_TOKENS - _SYSTEM_PROMPT_TOKENS - _estimate_tokens(batch_prompt) - CONTACT_TOKEN_MARGIN
+            ),
+            response_format=CONTACT_BATCH_RESPONSE_FORMAT
+        )
+        
+        if response.usage:
+            logger.debug(f"Tokens used: {response.usage.total_tokens} for {len(prompts)} companies")
+        
+        batch = _get_validator(ContactDetailsBatchSchema).validate_json(response.choices[0].message.content)
+        if len(batch.results) != len(prompts):
+            raise ValueError(f"Expected {len(prompts)} results, got {len(batch.results)}")
+        
+        return [item.model_dump_json(indent=2) for item in batch.results]
+    
+    async def get_contact_details_async(
+        self,
+        company_data: Dict[str, Any],
+        linkedin_job_url: Optional[str] = None,
+        additional_context: Optional[str] = None
+    ) -> str:
+        """
+        Async version of get_contact_details for concurrent bulk enrichment
+        
+        Concurrency is bounded by OPENAI_MAX_CONCURRENCY and, when set,
+        throughput by OPENAI_TPM_LIMIT (tokens per minute).
+        
+        Returns:
+            JSON string with contact details
+        """
+        if not isinstance(company_data, dict):
+            raise ValueError(f"company_data must be a dict, got {type(company_data)}: {company_data}")
+        
+        company_name = company_data.get('company_name', 'Unknown Company')
+        client = self._get_async_client()
+        
+        try:
+            # Prompt building hits the RAG service (BigQuery), keep it off the event loop
+            prompt = await asyncio.to_thread(
+                self._build_contact_details_prompt, company_data, linkedin_job_url, additional_context
+            )
+            
+            cache_key = self._response_cache_key(company_name, prompt)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"OpenAI contact details cache hit for {company_name}")
+                return cached
+            
+            for model in self.models:
+                result = await self._request_contact_details_async(client, model, prompt)
+                reason = self._escalation_reason(result)
+                if reason is None or model == self.models[-1]:
+                    break
+                logger.info(f"Escalating contact details for {company_name} from {model}: {reason}")
+            
+            if not self._validate(result):
+                cache.set(cache_key, result, self.cache_ttl)
+            
+            logger.info(f"OpenAI contact details retrieved for {company_name} ({model})")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to get contact details for {company_name}: {str(e)}")
+            raise
+    
+    async def _request_contact_details_async(self, client: AsyncOpenAI, model: str, prompt: str) -> str:
+        """Run one contact-details completion within the concurrency and rate limits"""
+        async with self._semaphore:
+            await self._rate_limiter.wait()
+            response = await client.chat.completions.create(
+                model=model,
                 messages=[
                     {
                         "role": "system",
-                        "content": self._get_system_prompt()
+                        "content": _SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
-                temperature=0.0,  # Low temperature for factual, consistent responses
-                max_tokens=4096
+                temperature=0.0,
+                max_tokens=self._max_output_tokens(prompt),
+                response_format=CONTACT_RESPONSE_FORMAT
             )
-            
-            result = response.choices[0].message.content
-            
-            logger.info(f"OpenAI contact details retrieved for {company_name}")
-            logger.debug(f"Tokens used: {response.usage.total_tokens} (prompt: {response.usage.prompt_tokens}, completion: {response.usage.completion_tokens})")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Failed to get contact details for {company_name}: {str(e)}")
-            raise
+        
+        if response.usage:
+            self._rate_limiter.record(response.usage.total_tokens)
+        
+        return response.choices[0].message.content
     
-    def _get_system_prompt(self) -> str:
+    async def get_contact_details_many(self, companies: List[Dict[str, Any]]) -> List[Any]:
         """
-        System prompt that instructs GPT-4o to behave like a professional business research assistant
-        Following ChatGPT's recommendations for structured, factual responses
+        Get contact details for many companies concurrently
+        
+        Returns:
+            One entry per company, in order: the JSON string, or the exception
+            raised for that company
         """
-        return """You are a data extraction assistant that processes company information from provided sources.
-
-CRITICAL RULES - READ CAREFULLY:
-🚫 NEVER use your training data or general knowledge about companies
-🚫 NEVER make up or infer contact names, emails, or LinkedIn profiles
-🚫 NEVER hallucinate information not explicitly provided in the context
-✅ ONLY extract information that appears in the provided data sources
-✅ Use null for ANY data not found in the provided sources
-✅ If no contacts are found in the data, return empty decision_makers array
-
-YOUR CAPABILITIES:
-- Extract contact information from provided website data and job postings
-- Parse email addresses, phone numbers, and names from HTML/text content
-- Identify LinkedIn URLs that appear in the source data
-- Organize found information into structured JSON format
-
-WHAT YOU CANNOT DO:
-- Look up or recall information about companies from your training
-- Guess or infer people's names based on typical company structures
-- Construct LinkedIn URLs unless they appear in the provided data
-- Make assumptions about who works at the company
-
-OUTPUT STRUCTURE:
-Always return a valid JSON object with this exact structure:
-{
-  "company": {
-    "name": "Company Name",
-    "website": "https://example.com or null",
-    "linkedin_company": "https://linkedin.com/company/xxx or null",
-    "headquarters": "City, Country or null",
-    "description": "Brief factual description or null"
-  },
-  "general_contact": {
-    "email": "info@example.com or null",
-    "phone": "+1234567890 or null",
-    "contact_form": "https://example.com/contact or null"
-  },
-  "decision_makers": [
-    {
-      "name": "Full Name",
-      "title": "Job Title",
-      "department": "Department",
-      "linkedin_url": "https://linkedin.com/in/profile or null",
-      "email": "email@company.com or null",
-      "confidence": "high/medium/low"
-    }
-  ],
-  "social_media": {
-    "twitter": "@handle or null",
-    "facebook": "URL or null",
-    "youtube": "URL or null"
-  },
-  "notes": "Any verification notes or additional context"
-}
-
-EXTRACTION RULES:
-⚠️ Return ONLY the JSON object - no explanations, no markdown formatting, no preamble
-⚠️ Use null for ANY field where data is not found in provided sources
-⚠️ Empty decision_makers array [] if NO contacts found in data
-⚠️ Only include LinkedIn URLs if they EXPLICITLY appear in the provided data
-⚠️ Only include emails/phones that were FOUND in web scraping results
-⚠️ Mark confidence as "low" for any inferred data, "high" only for explicitly found data
-
-DATA SOURCE PRIORITY:
-1. Website scraping results (emails, phones, contact pages found by web browser)
-2. Job posting descriptions and contact information
-3. If NEITHER source has contact info → return null/empty arrays
-
-FORBIDDEN ACTIONS:
-❌ Do NOT use company name to guess executive names
-❌ Do NOT construct LinkedIn URLs from assumed name patterns
-❌ Do NOT fill in "typical" contact information
-❌ Do NOT use your knowledge of real people at real companies
-❌ Do NOT provide placeholder or example data
-
-REQUIRED BEHAVIOR:
-✅ If web scraping found 0 emails → general_contact.email = null
-✅ If no names found in data → decision_makers = []
-✅ Be honest in notes field: "No contacts found in provided data sources"
-"""
+        return await asyncio.gather(
+            *[self.get_contact_details_async(company_data) for company_data in companies],
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def _validate(result: str) -> List[str]:
+        """
+        Validate a contact-details response against ContactDetailsSchema
+        
+        Returns:
+            List of validation error messages (empty when the response is valid)
+        """
+        try:
+            _get_validator(ContactDetailsSchema).validate_json(result)
+        except ValidationError as e:
+            return [f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()]
+        return []
+    
+    @staticmethod
+    def _escalation_reason(result: str) -> Optional[str]:
+        """Why a cheaper model's answer should be retried on the next tier (None if it is fine)"""
+        try:
+            details = _get_validator(ContactDetailsSchema).validate_json(result)
+        except ValidationError as e:
+            return f"{e.error_count()} validation error(s)"
+        
+        low_confidence = sum(1 for contact in details.decision_makers if contact.confidence == 'low')
+        if low_confidence > MAX_LOW_CONFIDENCE_CONTACTS:
+            return f"{low_confidence} low-confidence contacts"
+        return None
+    
+    def invalidate_company(self, company_name: str):
+        """Drop cached contact details for a company (e.g. on a manual refresh)"""
+        version_key = self._company_version_key(company_name)
+        cache.set(version_key, (cache.get(version_key) or 0) + 1, None)
+    
+    def _company_version_key(self, company_name: str) -> str:
+        return f"openai:contact:version:{company_name.strip().lower()}"
+    
+    def _response_cache_key(self, company_name: str, prompt: str) -> str:
+        """
+        Cache key for a contact-details response
+        
+        Hashes the model, system prompt and normalized user prompt, so prompts
+        that only differ in volatile fields share an entry; the per-company
+        version lets invalidate_company() retire all entries for a company.
+        """
+        version = cache.get(self._company_version_key(company_name)) or 0
+        digest = hashlib.blake2b(
+            "\n".join([">".join(self.models), _SYSTEM_PROMPT, self._normalize_prompt(prompt)]).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        return f"openai:contact:v{version}:{digest}"
+    
+    @staticmethod
+    def _max_output_tokens(prompt: str) -> int:
+        """Tight output budget (decode time grows with the cap) that fits next to the prompt"""
+        prompt_tokens = _SYSTEM_PROMPT_TOKENS + _estimate_tokens(prompt)
+        max_tokens = max(
+            CONTACT_MIN_OUTPUT_TOKENS,
+            min(CONTACT_MAX_OUTPUT_TOKENS, CONTACT_CONTEXT_TOKENS - prompt_tokens - CONTACT_TOKEN_MARGIN)
+        )
+        logger.debug(f"max_tokens={max_tokens} for ~{prompt_tokens} prompt tokens")
+        return max_tokens
+    
+    @staticmethod
+    def _normalize_prompt(prompt: str) -> str:
+        """Strip volatile header fields and whitespace differences from a prompt"""
+        prompt = _VOLATILE_PROMPT_RE.sub('', prompt, count=1)
+        return _WHITESPACE_RE.sub(' ', prompt).strip().lower()
+    
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Get the async client and its limits for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            # Size the connection pool for the concurrency we allow, so every
+            # in-flight request gets a kept-alive connection instead of queueing
+            http_client = DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.http_pool_size,
+                    max_keepalive_connections=self.http_pool_size
+                )
+            )
+            self._async_client = AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            self._async_client_closer = loop.create_task(_close_at_loop_shutdown(self._async_client))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._rate_limiter = _TokenRateLimiter(self.tokens_per_minute)
+        return self._async_client
+    
+    @functools.cached_property
+    def rag(self):
+        """RAG service (process-wide singleton), resolved once per OpenAIService"""
+        return get_rag_service()
     
     def _build_contact_details_prompt(
         self,
@@ -191,8 +673,7 @@ REQUIRED BEHAVIOR:
         rag_context = ""
         if not additional_context:
             try:
-                rag_service = get_rag_service()
-                rag_data = rag_service.get_company_context(company_name)
+                rag_data = self.rag.get_company_context(company_name)
                 if rag_data.get('context'):
                     rag_context = f"\n\n{'='*60}\nDATA FROM JOB POSTINGS DATABASE:\n{'='*60}\n{rag_data['context']}\n{'='*60}\n"
             except Exception as e:
@@ -213,32 +694,7 @@ COMPANY INFORMATION:
 - Active Job Openings: {job_count}{linkedin_context}
 
 DATA SOURCES PROVIDED BELOW:
-{rag_context}
-
-EXTRACTION INSTRUCTIONS:
-1. Look ONLY in the data sources above for:
-   - Email addresses (from website scraping or job postings)
-   - Phone numbers (from website scraping)
-   - Contact names (from website scraping or job postings)
-   - LinkedIn URLs (ONLY if they appear in the data above)
-   
-2. If NO contacts found in the data:
-   - Return decision_makers: []
-   - Set general_contact fields to null
-   - In notes field, state: "No contact information found in provided data sources"
-
-3. If SOME contacts found:
-   - Only include what was explicitly found in the data
-   - Mark confidence as "high" for directly extracted data
-   - Prioritize data/analytics decision-makers if found in job postings
-
-4. DO NOT:
-   - Look up or recall information about this company from your training data
-   - Make up or infer names, emails, or LinkedIn profiles
-   - Construct LinkedIn URLs based on name patterns
-   - Fill in "typical" or "likely" contact information
-
-Return ONLY the JSON object (no markdown, no explanations)."""
+{rag_context}"""
 
 
 # Singleton instance
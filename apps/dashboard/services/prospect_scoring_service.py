@@ -2,12 +2,56 @@
 Prospect Scoring Service for Agiliz
 Intelligent scoring algorithm to identify best-fit companies for partnerships
 """
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Optional
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+import functools
+import hashlib
+import heapq
+import json
 import logging
+import re
+import sys
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Bump when weights/thresholds change so cached scores are recomputed
+SCORING_VERSION = 3
+PROSPECT_SCORE_CACHE_TTL = 3600
+# Whole scored/sorted batches are bigger and re-requested in bursts (re-renders,
+# filter toggles), so they are kept for a shorter time
+PROSPECT_BATCH_CACHE_TTL = 300
+
+# Job-count thresholds and the activity score for each band between them:
+# 0 jobs -> 0, 1-2 -> 6, 3-4 -> 12 (some growth), 5-19 -> 15 (IDEAL: growing,
+# needs support), 20-49 -> 5 (enterprise, lower priority), 50+ -> -10 (tech
+# giant that builds internally - avoid)
+ACTIVITY_THRESHOLDS = (1, 3, 5, 10, 20, 50)
+ACTIVITY_SCORES = (0, 6, 12, 15, 15, 5, -10)
+
+# (max days since discovery, recency score), checked in order
+RECENCY_BUCKETS = ((7, 5), (30, 3), (90, 1))
+
+# Upper bound on memoized industry/size strings (the vocabularies are small)
+SCORE_MEMO_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _joined_tech_stack(tech_stack: tuple) -> str:
+    """
+    Lower-case a tech stack into one newline-separated buffer (cached per stack)
+    
+    No keyword contains a newline, so a keyword found in the buffer always lies
+    within a single stack item.
+    """
+    return '\n'.join(tech_stack).lower()
+
 
 class ProspectScoringService:
     """
@@ -22,54 +66,84 @@ class ProspectScoringService:
     - Recency (newly discovered companies)
     """
     
-    def __init__(self):
-        # Agiliz core tech stack
-        self.core_tech = ['bigquery', 'looker', 'gcp', 'google cloud platform', 
-                         'microstrategy', 'vertex ai', 'looker studio', 'lookml']
-        
-        # Secondary relevant tech
-        self.secondary_tech = ['dataflow', 'dataproc', 'cloud storage', 'pubsub',
-                              'cloud composer', 'cloud functions', 'cloud run']
-        
-        # Ideal company types (weighted) - Focus on companies that NEED our services
-        self.company_type_weights = {
-            'Retail': 10,              # Top priority - need data insights
-            'Manufacturing': 10,       # Top priority - need data insights
-            'Healthcare': 10,          # Top priority - need data insights
-            'Finance': 9,              # High priority - data intensive
-            'Logistics': 8,            # High priority - optimization needs
-            'Energy': 8,               # High priority - analytics needs
-            'Education': 7,            # Good fit - growing data needs
-            'Government': 6,           # Moderate fit
-            'Hospitality': 5,          # Some potential
-            'Technology': -10,         # AVOID - they build their own
-            'Consulting (Technology)': -10,  # AVOID - competitors
-            'Consulting (Business)': -10,    # AVOID - competitors
-            'Other': 2
+    # Scoring tables are process-wide constants: shared by every instance and
+    # built once at import (see _init_tables) rather than per construction
+    
+    # Agiliz core tech stack
+    core_tech = ('bigquery', 'looker', 'gcp', 'google cloud platform', 
+                 'microstrategy', 'vertex ai', 'looker studio', 'lookml')
+    
+    # Secondary relevant tech
+    secondary_tech = ('dataflow', 'dataproc', 'cloud storage', 'pubsub',
+                      'cloud composer', 'cloud functions', 'cloud run')
+    
+    # Ideal company types (weighted) - Focus on companies that NEED our services
+    company_type_weights = {
+        'Retail': 10,              # Top priority - need data insights
+        'Manufacturing': 10,       # Top priority - need data insights
+        'Healthcare': 10,          # Top priority - need data insights
+        'Finance': 9,              # High priority - data intensive
+        'Logistics': 8,            # High priority - optimization needs
+        'Energy': 8,               # High priority - analytics needs
+        'Education': 7,            # Good fit - growing data needs
+        'Government': 6,           # Moderate fit
+        'Hospitality': 5,          # Some potential
+        'Technology': -10,         # AVOID - they build their own
+        'Consulting (Technology)': -10,  # AVOID - competitors
+        'Consulting (Business)': -10,    # AVOID - competitors
+        'Other': 2
+    }
+    
+    # Ideal industries - Companies that NEED data services
+    high_value_industries = (
+        'Retail', 'E-commerce', 'Manufacturing', 'Healthcare', 
+        'Biotechnology Research', 'Pharmaceutical Manufacturing',
+        'Financial Services', 'Banking', 'Insurance',
+        'Transportation', 'Logistics', 'Supply Chain',
+        'Energy', 'Utilities', 'Oil and Gas',
+        'Hospitality', 'Food and Beverage', 'Consumer Goods'
+    )
+    
+    # Industries to avoid - Tech companies and competitors
+    avoid_industries = (
+        'Software Development', 'IT Services and IT Consulting',
+        'Information Services and Technology', 'Information and Internet',
+        'Technology', 'Computer Software', 'Internet',
+        'Business Consulting and Services', 'Professional Services',
+        'Staffing and Recruiting', 'Management Consulting'
+    )
+    
+    @classmethod
+    def _init_tables(cls):
+        """Derive the lookup structures scoring uses from the tables above"""
+        # Final 0-20 score per company type, so scoring is a single lookup
+        cls._company_type_scores = {
+            company_type: cls._company_type_weight_to_score(weight)
+            for company_type, weight in cls.company_type_weights.items()
         }
         
-        # Ideal industries - Companies that NEED data services
-        self.high_value_industries = [
-            'Retail', 'E-commerce', 'Manufacturing', 'Healthcare', 
-            'Biotechnology Research', 'Pharmaceutical Manufacturing',
-            'Financial Services', 'Banking', 'Insurance',
-            'Transportation', 'Logistics', 'Supply Chain',
-            'Energy', 'Utilities', 'Oil and Gas',
-            'Hospitality', 'Food and Beverage', 'Consumer Goods'
-        ]
+        # Distinct lower-case tech keywords, each searched for once per stack
+        cls._tech_keywords = tuple(dict.fromkeys(
+            sys.intern(tech.lower()) for tech in cls.core_tech + cls.secondary_tech
+        ))
         
-        # Industries to avoid - Tech companies and competitors
-        self.avoid_industries = [
-            'Software Development', 'IT Services and IT Consulting',
-            'Information Services and Technology', 'Information and Internet',
-            'Technology', 'Computer Software', 'Internet',
-            'Business Consulting and Services', 'Professional Services',
-            'Staffing and Recruiting', 'Management Consulting'
-        ]
+        # Industries only need a yes/no answer: a plain case-insensitive alternation
+        cls._avoid_industry_pattern = re.compile(
+            '|'.join(re.escape(industry) for industry in cls.avoid_industries), re.IGNORECASE
+        )
+        cls._high_value_industry_pattern = re.compile(
+            '|'.join(re.escape(industry) for industry in cls.high_value_industries), re.IGNORECASE
+        )
+    
+    def __init__(self):
+        # Per-string memo for industry/size scores, which are pure functions
+        # of a short string drawn from a small vocabulary
+        self._industry_scores: Dict[str, int] = {}
+        self._size_scores: Dict[str, int] = {}
     
     def calculate_prospect_score(self, company: Dict[str, Any], job_count: int = 0) -> Dict[str, Any]:
         """
-        Calculate comprehensive prospect score for a company
+        Calculate comprehensive prospect score for a company (cached by scoring inputs)
         
         Returns:
             {
@@ -86,89 +160,129 @@ class ProspectScoringService:
                 'reasoning': str
             }
         """
-        try:
-            breakdown = {}
-            reasoning_parts = []
-            
-            # 1. Tech Stack Score (0-30 points)
-            # Use tech_stacks (plural) as that's what BigQuery returns
-            tech_stack = company.get('tech_stacks', company.get('tech_stack', []))
-            tech_score = self._score_tech_stack(tech_stack)
-            breakdown['tech_score'] = tech_score
-            if tech_score >= 20:
-                reasoning_parts.append(f"Strong tech alignment ({tech_score}/30)")
-            elif tech_score >= 10:
-                reasoning_parts.append(f"Moderate tech alignment ({tech_score}/30)")
-            
-            # 2. Company Type Score (0-20 points)
-            company_type_score = self._score_company_type(company.get('company_type', ''))
-            breakdown['company_type_score'] = company_type_score
-            if company_type_score < 0:
-                reasoning_parts.append(f"Consulting firm - likely competitor")
-            elif company_type_score >= 8:
-                reasoning_parts.append(f"Ideal company type: {company.get('company_type')}")
-            
-            # 3. Industry Score (0-15 points)
-            industry_score = self._score_industry(company.get('company_industry', ''))
-            breakdown['industry_score'] = industry_score
-            
-            # 4. Company Size Score (0-15 points)
-            size_score = self._score_company_size(company.get('company_size', ''))
-            breakdown['size_score'] = size_score
-            if size_score >= 12:
-                reasoning_parts.append(f"Enterprise size: {company.get('company_size')}")
-            
-            # 5. Activity Score (Job Volume) (0-15 points)
-            activity_score = self._score_activity(job_count)
-            breakdown['activity_score'] = activity_score
-            if activity_score >= 10:
-                reasoning_parts.append(f"Active hiring ({job_count} jobs) indicates growth")
-            
-            # 6. Recency Score (0-5 points)
-            recency_score = self._score_recency(company.get('created_at'))
-            breakdown['recency_score'] = recency_score
-            if recency_score >= 4:
-                reasoning_parts.append("Newly discovered company")
-            
-            # Calculate total score
-            total_score = max(0, min(100, 
-                tech_score + company_type_score + industry_score + 
-                size_score + activity_score + recency_score
-            ))
-            
-            # Categorize
-            if total_score >= 70 and company_type_score >= 0:
-                category = 'Hot Prospect'
-                emoji = '🔥'
-            elif total_score >= 50 and company_type_score >= 0:
-                category = 'Warm Lead'
-                emoji = '⭐'
-            elif total_score >= 30:
-                category = 'Cold Lead'
-                emoji = '❄️'
+        cache_key = self._score_cache_key(company, job_count)
+        score_data = cache.get(cache_key)
+        if score_data is None:
+            try:
+                score_data = self._compute_prospect_score(company, job_count)
+            except Exception as e:
+                logger.error(f"Error calculating prospect score: {str(e)}")
+                score_data = _unknown_score()
             else:
-                category = 'Avoid'
-                emoji = '🚫'
-            
-            reasoning = f"{emoji} {category}: " + "; ".join(reasoning_parts) if reasoning_parts else f"{emoji} {category}"
-            
-            return {
-                'total_score': total_score,
-                'category': category,
-                'emoji': emoji,
-                'breakdown': breakdown,
-                'reasoning': reasoning
-            }
-            
-        except Exception as e:
-            logger.error(f"Error calculating prospect score: {str(e)}")
-            return {
-                'total_score': 0,
-                'category': 'Unknown',
-                'emoji': '❓',
-                'breakdown': {},
-                'reasoning': 'Error calculating score'
+                cache.set(cache_key, score_data, PROSPECT_SCORE_CACHE_TTL)
+        return {
+            **score_data,
+            'reasoning': self._reasoning(
+                company.get('company_type', ''), company.get('company_size', ''), job_count,
+                score_data['breakdown'], score_data['category'], score_data['emoji']
+            )
+        }
+    
+    def _compute_prospect_score(self, company: Dict[str, Any], job_count: int = 0,
+                                now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Uncached implementation of calculate_prospect_score, without the reasoning text
+        
+        Raises on malformed input; callers decide how to isolate failures.
+        """
+        # Read each field once
+        # Use tech_stacks (plural) as that's what BigQuery returns
+        tech_stack = company.get('tech_stacks', company.get('tech_stack', []))
+        company_type = company.get('company_type', '')
+        company_industry = company.get('company_industry', '')
+        company_size = company.get('company_size', '')
+        created_at = company.get('created_at')
+        
+        tech_score = self._score_tech_stack(tech_stack)              # 0-30 points
+        company_type_score = self._score_company_type(company_type)  # 0-20 points
+        industry_score = self._score_industry(company_industry)      # 0-15 points
+        size_score = self._score_company_size(company_size)          # 0-15 points
+        activity_score = self._score_activity(job_count)             # 0-15 points
+        recency_score = self._score_recency(created_at, now)         # 0-5 points
+        
+        total_score, category, emoji = _finalize_score(
+            tech_score, company_type_score, industry_score,
+            size_score, activity_score, recency_score
+        )
+        
+        return {
+            'total_score': total_score,
+            'category': category,
+            'emoji': emoji,
+            'breakdown': {
+                'tech_score': tech_score,
+                'company_type_score': company_type_score,
+                'industry_score': industry_score,
+                'size_score': size_score,
+                'activity_score': activity_score,
+                'recency_score': recency_score
             }
+        }
+    
+    @staticmethod
+    def _score_cache_key(company: Dict[str, Any], job_count: int) -> str:
+        """Cache key over exactly the fields that feed the score"""
+        fields = [
+            company.get('tech_stacks', company.get('tech_stack', [])),
+            company.get('company_type', ''),
+            company.get('company_industry', ''),
+            company.get('company_size', ''),
+            job_count,
+            company.get('created_at'),
+        ]
+        digest = hashlib.blake2b(
+            json.dumps(fields, sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        return f"prospect_score:v{SCORING_VERSION}:{digest}"
+    
+    @staticmethod
+    def _categorize(total_score: int, company_type_score: int) -> tuple:
+        """Map a total score to its (category, emoji)"""
+        if total_score >= 70 and company_type_score >= 0:
+            return 'Hot Prospect', '🔥'
+        elif total_score >= 50 and company_type_score >= 0:
+            return 'Warm Lead', '⭐'
+        elif total_score >= 30:
+            return 'Cold Lead', '❄️'
+        else:
+            return 'Avoid', '🚫'
+    
+    @staticmethod
+    def _reasoning(company_type: str, company_size: str, job_count: int,
+                   breakdown: Dict[str, int], category: str, emoji: str) -> str:
+        """
+        Human-readable summary of the strongest scoring signals
+        
+        Derived from the breakdown on demand (it isn't cached), so callers only
+        pay for it on the rows they actually return.
+        """
+        if category == 'Unknown':
+            return 'Error calculating score'
+        
+        reasoning_parts = []
+        
+        tech_score = breakdown['tech_score']
+        if tech_score >= 20:
+            reasoning_parts.append(f"Strong tech alignment ({tech_score}/30)")
+        elif tech_score >= 10:
+            reasoning_parts.append(f"Moderate tech alignment ({tech_score}/30)")
+        
+        if breakdown['company_type_score'] < 0:
+            reasoning_parts.append(f"Consulting firm - likely competitor")
+        elif breakdown['company_type_score'] >= 8:
+            reasoning_parts.append(f"Ideal company type: {company_type}")
+        
+        if breakdown['size_score'] >= 12:
+            reasoning_parts.append(f"Enterprise size: {company_size}")
+        
+        if breakdown['activity_score'] >= 10:
+            reasoning_parts.append(f"Active hiring ({job_count} jobs) indicates growth")
+        
+        if breakdown['recency_score'] >= 4:
+            reasoning_parts.append("Newly discovered company")
+        
+        return f"{emoji} {category}: " + "; ".join(reasoning_parts) if reasoning_parts else f"{emoji} {category}"
     
     def _score_tech_stack(self, tech_stack: List[str]) -> int:
         """Score based on tech stack alignment (0-30 points)
@@ -181,33 +295,24 @@ class ProspectScoringService:
         if not tech_stack:
             return 0
         
-        tech_stack_lower = [tech.lower() for tech in tech_stack]
-        matched_techs = set()
-        
-        # Check for core tech matches (6 points each)
-        for tech in self.core_tech:
-            if any(tech in stack_item for stack_item in tech_stack_lower):
-                matched_techs.add(tech)
-        
-        # Check for secondary tech matches (6 points each)
-        for tech in self.secondary_tech:
-            if any(tech in stack_item for stack_item in tech_stack_lower):
-                matched_techs.add(tech)
+        # Core and secondary tech matches (6 points each): one C-level substring
+        # search per keyword over the whole stack, rather than per stack item
+        stack = _joined_tech_stack(tech_stack if isinstance(tech_stack, tuple) else tuple(tech_stack))
+        matched_count = sum(1 for tech in self._tech_keywords if tech in stack)
         
         # Calculate score: 6 points per unique matched technology
-        score = len(matched_techs) * 6
+        score = matched_count * 6
         
         return min(30, score)
     
     def _score_company_type(self, company_type: str) -> int:
         """Score based on company type (0-20 points, can be negative)"""
-        if not company_type:
-            return 5  # Neutral
-        
-        # Direct match
-        weight = self.company_type_weights.get(company_type, 2)
-        
-        # Convert to 0-20 scale (or negative for consulting)
+        # Missing (neutral) and unlisted types both score 5
+        return self._company_type_scores.get(company_type, 5)
+    
+    @staticmethod
+    def _company_type_weight_to_score(weight: int) -> int:
+        """Convert a company type weight to the 0-20 scale (or negative for consulting)"""
         if weight >= 8:
             return 20
         elif weight >= 6:
@@ -221,21 +326,27 @@ class ProspectScoringService:
     
     def _score_industry(self, industry: str) -> int:
         """Score based on industry (0-15 points)"""
+        return _memoized(self._industry_scores, industry, self._compute_industry_score)
+    
+    def _compute_industry_score(self, industry: str) -> int:
         if not industry:
             return 5
         
         # Avoid industries
-        if any(avoid.lower() in industry.lower() for avoid in self.avoid_industries):
+        if self._avoid_industry_pattern.search(industry):
             return 0
         
         # High-value industries
-        if any(valuable.lower() in industry.lower() for valuable in self.high_value_industries):
+        if self._high_value_industry_pattern.search(industry):
             return 15
         
         return 8  # Neutral
     
     def _score_company_size(self, company_size: str) -> int:
         """Score based on company size (0-15 points)"""
+        return _memoized(self._size_scores, company_size, self._compute_company_size_score)
+    
+    def _compute_company_size_score(self, company_size: str) -> int:
         if not company_size:
             return 5
         
@@ -258,23 +369,17 @@ class ProspectScoringService:
         IDEAL: 3-20 jobs indicates growth company that needs help
         AVOID: 50+ jobs indicates tech giant that builds internally
         """
-        if job_count >= 50:
-            return -10  # Tech giant, likely Google/Microsoft - avoid
-        elif job_count >= 20:
-            return 5   # Too large/enterprise, lower priority
-        elif job_count >= 10:
-            return 15  # IDEAL - active hiring, manageable size
-        elif job_count >= 5:
-            return 15  # IDEAL - growing, needs support
-        elif job_count >= 3:
-            return 12  # Good - some growth
-        elif job_count >= 1:
-            return 6
-        else:
-            return 0
+        if job_count != job_count:
+            # NaN fails every >= comparison, so it scores as no jobs (bisect would put it in the 50+ bucket)
+            return ACTIVITY_SCORES[0]
+        return ACTIVITY_SCORES[bisect_right(ACTIVITY_THRESHOLDS, job_count)]
     
-    def _score_recency(self, created_at: Optional[str]) -> int:
-        """Score based on when company was discovered (0-5 points)"""
+    def _score_recency(self, created_at: Optional[str], now: Optional[datetime] = None) -> int:
+        """
+        Score based on when company was discovered (0-5 points)
+        
+        Pass now (aware UTC) to reuse one timestamp across many calls.
+        """
         if not created_at:
             return 0
         
@@ -285,70 +390,306 @@ class ProspectScoringService:
             else:
                 created_date = created_at
             
-            days_ago = (datetime.utcnow() - created_date).days
+            # Naive timestamps are UTC; aware ones (BigQuery TIMESTAMP) compare as-is
+            if created_date.tzinfo is None:
+                created_date = created_date.replace(tzinfo=timezone.utc)
             
-            if days_ago <= 7:
-                return 5  # New this week
-            elif days_ago <= 30:
-                return 3  # New this month
-            elif days_ago <= 90:
-                return 1  # Last quarter
-            else:
-                return 0  # Old
+            days_ago = ((now or datetime.now(timezone.utc)) - created_date).days
+            
+            # New this week / this month / last quarter; older scores 0
+            for max_days, score in RECENCY_BUCKETS:
+                if days_ago <= max_days:
+                    return score
+            return 0
         except Exception as e:
             logger.warning(f"Error parsing created_at: {str(e)}")
             return 0
     
-    def score_companies_batch(self, companies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Score multiple companies and sort by score"""
-        scored_companies = []
+    def _score_recency_column(self, created_at: List[Any]) -> np.ndarray:
+        """Vectorized _score_recency: parse the whole column at once against a single 'now'"""
+        created_dates = pd.to_datetime(
+            pd.Series(created_at, dtype=object), utc=True, errors='coerce', format='mixed'
+        )
+        days_ago = (pd.Timestamp.now(tz=timezone.utc) - created_dates).dt.days.to_numpy()
         
-        for company in companies:
-            score_data = self.calculate_prospect_score(
-                company, 
-                company.get('job_count', 0)
-            )
+        return np.select(
+            [days_ago <= max_days for max_days, _ in RECENCY_BUCKETS],
+            [score for _, score in RECENCY_BUCKETS],
+            default=0
+        )
+    
+    def score_companies_batch(self, companies: List[Dict[str, Any]],
+                              refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Score multiple companies and sort by score
+        
+        The whole sorted result is cached by a fingerprint of the input, so
+        dashboard re-renders over an unchanged company list are a single cache
+        read; pass refresh=True to recompute it. Below that, scores are cached
+        per company (keyed by the scoring inputs) and the misses are computed
+        column-wise: categorical fields are scored once per distinct value and
+        numeric thresholds with NumPy, instead of running the full per-company
+        pipeline for every row.
+        """
+        if not companies:
+            return []
+        
+        batch_key = self._batch_cache_key(companies)
+        if not refresh:
+            scored_companies = cache.get(batch_key)
+            if scored_companies is not None:
+                return scored_companies
+        
+        scored_companies = self._score_companies(companies)
+        
+        # Sort by score (descending); itemgetter keeps the key function in C
+        scored_companies.sort(key=itemgetter('prospect_score'), reverse=True)
+        
+        if all(c['prospect_category'] != 'Unknown' for c in scored_companies):
+            cache.set(batch_key, scored_companies, PROSPECT_BATCH_CACHE_TTL)
+        
+        return scored_companies
+    
+    @staticmethod
+    def _batch_cache_key(companies: List[Dict[str, Any]]) -> str:
+        """Cache key over the full input (results carry every company field)"""
+        digest = hashlib.blake2b(
+            json.dumps(companies, sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        return f"prospect_batch:v{SCORING_VERSION}:{digest}"
+    
+    def _score_companies(self, companies: List[Dict[str, Any]],
+                         with_reasoning: bool = True) -> List[Dict[str, Any]]:
+        """
+        score_companies_batch without the final sort (rows keep input order)
+        
+        With with_reasoning=False rows have no 'score_reasoning' yet; add it
+        with _add_reasoning to just the rows that are kept.
+        """
+        if not companies:
+            return []
+        
+        keys = [self._score_cache_key(company, company.get('job_count', 0)) for company in companies]
+        cached = cache.get_many(keys)
+        
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if missing:
+            # The columnar path coerces job_count to float, so only rows where that
+            # is lossless use it; the rest ('5', None, ...) are scored one by
+            # one, failing to Unknown exactly as calculate_prospect_score does
+            columnar = [i for i in missing if _is_plain_number(companies[i].get('job_count', 0))]
+            computed = {}
+            if columnar:
+                try:
+                    computed.update(zip(
+                        columnar, self._score_companies_vectorized([companies[i] for i in columnar])
+                    ))
+                except Exception as e:
+                    # Retry per company so one malformed row doesn't fail the batch
+                    logger.warning(f"Vectorized scoring failed, scoring companies one by one: {str(e)}")
             
-            scored_company = {
-                **company,
-                'prospect_score': score_data['total_score'],
-                'prospect_category': score_data['category'],
-                'prospect_emoji': score_data['emoji'],
-                'score_breakdown': score_data['breakdown'],
-                'score_reasoning': score_data['reasoning']
-            }
-            scored_companies.append(scored_company)
+            now = datetime.now(timezone.utc)
+            for i in missing:
+                if i in computed:
+                    continue
+                company = companies[i]
+                try:
+                    computed[i] = self._compute_prospect_score(company, company.get('job_count', 0), now)
+                except Exception as e:
+                    logger.error(f"Error calculating prospect score: {str(e)}")
+                    computed[i] = _unknown_score()
+            
+            fresh = {}
+            for i in missing:
+                score_data = computed[i]
+                cached[keys[i]] = score_data
+                if score_data['category'] != 'Unknown':
+                    fresh[keys[i]] = score_data
+            cache.set_many(fresh, PROSPECT_SCORE_CACHE_TTL)
         
-        # Sort by score (descending)
-        scored_companies.sort(key=lambda x: x['prospect_score'], reverse=True)
+        # Callers keep using their own company dicts, so results are copies;
+        # dict.copy() plus item assignment is cheaper than a {**company, ...} merge
+        scored_companies = []
+        append = scored_companies.append
+        for company, key in zip(companies, keys):
+            score_data = cached[key]
+            scored = company.copy()
+            scored['prospect_score'] = score_data['total_score']
+            scored['prospect_category'] = score_data['category']
+            scored['prospect_emoji'] = score_data['emoji']
+            scored['score_breakdown'] = score_data['breakdown']
+            if with_reasoning:
+                self._add_reasoning(scored)
+            append(scored)
         
         return scored_companies
     
+    def _add_reasoning(self, scored: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in a scored row's 'score_reasoning'"""
+        scored['score_reasoning'] = self._reasoning(
+            scored.get('company_type'), scored.get('company_size'), scored.get('job_count', 0),
+            scored['score_breakdown'], scored['prospect_category'], scored['prospect_emoji']
+        )
+        return scored
+    
+    def _score_companies_vectorized(self, companies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Columnar calculate_prospect_score over many companies (uncached)"""
+        # Every categorical scorer returns its default for any falsy value, so
+        # missing/None values can share the '' bucket
+        def column(field: str) -> pd.Series:
+            return pd.Series([company.get(field) or '' for company in companies], dtype=object)
+        
+        # Tech stacks repeat across companies too (same skill sets), so they are
+        # scored per distinct stack like the categorical columns
+        tech_scores = _score_distinct(
+            pd.Series([
+                tuple(company.get('tech_stacks', company.get('tech_stack', [])) or ())
+                for company in companies
+            ], dtype=object),
+            self._score_tech_stack
+        )
+        company_type_scores = (
+            column('company_type').map(self._company_type_scores).fillna(5).to_numpy(dtype=np.int64)
+        )
+        industry_scores = _score_distinct(column('company_industry'), self._score_industry)
+        size_scores = _score_distinct(column('company_size'), self._score_company_size)
+        recency_scores = self._score_recency_column(
+            [company.get('created_at') for company in companies]
+        )
+        
+        job_counts = np.nan_to_num(
+            np.array([company.get('job_count', 0) for company in companies], dtype=np.float64), nan=0
+        )
+        activity_scores = np.array(ACTIVITY_SCORES, dtype=np.int64)[
+            np.searchsorted(ACTIVITY_THRESHOLDS, job_counts, side='right')
+        ]
+        
+        total_scores = np.clip(
+            tech_scores + company_type_scores + industry_scores +
+            size_scores + activity_scores + recency_scores,
+            0, 100
+        )
+        
+        columns = zip(
+            tech_scores.tolist(), company_type_scores.tolist(), industry_scores.tolist(),
+            size_scores.tolist(), activity_scores.tolist(), recency_scores.tolist(),
+            total_scores.tolist()
+        )
+        
+        results = []
+        for tech, company_type, industry, size, activity, recency, total in columns:
+            category, emoji = self._categorize(total, company_type)
+            results.append({
+                'total_score': total,
+                'category': category,
+                'emoji': emoji,
+                'breakdown': {
+                    'tech_score': tech,
+                    'company_type_score': company_type,
+                    'industry_score': industry,
+                    'size_score': size,
+                    'activity_score': activity,
+                    'recency_score': recency
+                }
+            })
+        
+        return results
+    
     def get_top_prospects(self, companies: List[Dict[str, Any]], 
                          limit: int = 5, 
                          min_score: int = 50) -> List[Dict[str, Any]]:
         """Get top N prospects above minimum score threshold"""
-        scored = self.score_companies_batch(companies)
+        # Avoid consulting firms: they are never returned, so don't score them at all
+        candidates = [c for c in companies if c.get('company_type') != 'Consulting (Business)']
+        scored = self._score_companies(candidates, with_reasoning=False)
         
-        # Filter by minimum score and avoid consulting firms
-        filtered = [c for c in scored if c['prospect_score'] >= min_score 
-                   and c.get('company_type') != 'Consulting (Business)']
+        # Filter by minimum score, then select the top N with a bounded heap
+        # instead of sorting every company (ties keep input order, as sorted() would)
+        filtered = (c for c in scored if c['prospect_score'] >= min_score)
+        top = heapq.nlargest(limit, filtered, key=itemgetter('prospect_score'))
         
-        return filtered[:limit]
+        # Reasoning text is only built for the companies being returned
+        return [self._add_reasoning(c) for c in top]
     
     def find_tech_specific_prospects(self, companies: List[Dict[str, Any]], 
                                     tech_keyword: str, 
-                                    limit: int = 5) -> List[Dict[str, Any]]:
-        """Find prospects with specific technology focus"""
+                                    limit: int = 5,
+                                    tech_index: Optional[Dict[str, List[int]]] = None) -> List[Dict[str, Any]]:
+        """
+        Find prospects with specific technology focus
+        
+        Pass tech_index (from build_tech_index(companies)) when querying the
+        same companies for several keywords.
+        """
         tech_lower = tech_keyword.lower()
+        if tech_index is None:
+            tech_index = self.build_tech_index(companies)
         
-        # Filter companies with the specific tech
-        tech_companies = [c for c in companies 
-                         if any(tech_lower in str(t).lower() 
-                               for t in c.get('tech_stack', []))]
+        # Filter companies with the specific tech: substring-test each distinct
+        # stack item once instead of every item of every company
+        matching = set()
+        for tech, company_idxs in tech_index.items():
+            if tech_lower in tech:
+                matching.update(company_idxs)
+        tech_companies = [companies[i] for i in sorted(matching)]
         
         # Score and return top matches
         return self.get_top_prospects(tech_companies, limit=limit, min_score=40)
+    
+    @staticmethod
+    def build_tech_index(companies: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        """Map each distinct lower-cased tech_stack item to the indexes of the companies listing it"""
+        tech_index = defaultdict(list)
+        for i, company in enumerate(companies):
+            for tech in set(str(t).lower() for t in company.get('tech_stack', [])):
+                tech_index[tech].append(i)
+        return tech_index
+
+
+ProspectScoringService._init_tables()
+
+
+def _unknown_score() -> Dict[str, Any]:
+    """Score reported (and never cached) for a company that failed to score"""
+    return {
+        'total_score': 0,
+        'category': 'Unknown',
+        'emoji': '❓',
+        'breakdown': {}
+    }
+
+
+def _finalize_score(tech: int, company_type: int, industry: int,
+                    size: int, activity: int, recency: int) -> tuple:
+    """Sum the sub-scores, clamp to 0-100 and categorize: (total, category, emoji)"""
+    total = tech + company_type + industry + size + activity + recency
+    if total < 0:
+        total = 0
+    elif total > 100:
+        total = 100
+    return (total,) + ProspectScoringService._categorize(total, company_type)
+
+
+def _is_plain_number(value: Any) -> bool:
+    """True for int/float values (safe to score as a float column)"""
+    return isinstance(value, (int, float))
+
+
+def _memoized(memo: Dict[Any, int], value: Any, scorer: Callable[[Any], int]) -> int:
+    """Look up value's score in memo, computing (and remembering) it on a miss"""
+    score = memo.get(value)
+    if score is None:
+        score = scorer(value)
+        if len(memo) < SCORE_MEMO_SIZE:
+            memo[value] = score
+    return score
+
+
+def _score_distinct(values: pd.Series, scorer: Callable[[Any], int]) -> np.ndarray:
+    """Apply scorer once per distinct value and broadcast the results back to every row"""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.array([scorer(value) for value in uniques], dtype=np.int64)[codes]
 
 
 # Singleton instance
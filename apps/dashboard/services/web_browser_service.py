@@ -3,16 +3,196 @@ Web Browser Service for Contact Research
 Safely browses company websites (NOT LinkedIn) to find contact information
 Uses requests + BeautifulSoup - no Selenium needed for most sites
 """
+import atexit
+import functools
+import hashlib
+import itertools
 import logging
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
 import re
+import threading
 import time
 
+from django.core.cache import cache
+from pydantic_core import from_json
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on pages of one site fetched at the same time
+MAX_CONCURRENT_PAGES = 8
+
+# Keep-alive connections per host pool (and host pools kept): enough for the
+# concurrent fetches plus redirect/cross-host hops without evicting sockets
+HTTP_POOL_SIZE = 32
+
+# Most contact names returned per page
+MAX_NAMES = 30
+
+# How long browsed pages and website lookups are reused (re-enriching the same
+# company within these windows skips the HTTP fetch, parse and AI extraction)
+PAGE_CACHE_TTL = 3600
+WEBSITE_CACHE_TTL = 86400
+
+# Extraction patterns, compiled once at import rather than on every page
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_MAILTO_RE = re.compile(r'^mailto:')
+_TEL_RE = re.compile(r'^tel:')
+# Phone formats, tried in this order at each position by one combined scan
+_PHONE_PATTERNS = (
+    r'Tel\.?\s*\+\d{1,3}[\s\d]+',  # "Tel. +31 30 2 123 123" or "Tel +45 7020 2728"
+    r'\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,4}',  # International: +31 30 2 123 123
+    r'\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,4}',  # +1 (555) 123-4567
+    r'\d{2,4}[\s.-]\d{1,4}[\s.-]\d{1,4}[\s.-]\d{1,4}',  # European: 030 123 456 78
+    r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # US: (555) 123-4567
+)
+_PHONE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _PHONE_PATTERNS))
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_DIGIT_RE = re.compile(r'\d')
+# Dutch postal address: "Street Number, 1234 AB City"
+_POSTAL_RE = re.compile(
+    r'([A-Z][a-zà-ÿ]+(?:\s+[A-Z][a-zà-ÿ]+)*\s+\d+[a-zA-Z]?\s*,?\s*\d{4}\s*[A-Z]{2}\s+[A-Z][a-zà-ÿ]+)',
+    re.MULTILINE
+)
+# Title-case headings in team sections that are not names (case-sensitive)
+_HEADING_SKIP_RE = re.compile(r'View Our|Meet The|Our Team|The Team|Contact Us|Get In Touch')
+# Job titles that mark the previous line as a probable name (substring match, so
+# "Head of Data" and "Team Lead" count; "Vice President" is covered by President)
+_TITLE_RE = re.compile(r'CEO|COO|CFO|CTO|Director|Manager|President|VP|Head|Chief|Lead')
+# Lower-cased phrases that mark a "name" candidate as a false positive
+_NAME_SKIP_PATTERNS = (
+    'read more', 'learn more', 'click here', 'view', 'see more',
+    'the team', 'our team', 'meet', 'about us', 'contact',
+    'the leadership', 'leadership team', 'management team'
+)
+# All skip phrases in one pass over the name
+_NAME_SKIP_RE = re.compile('|'.join(map(re.escape, _NAME_SKIP_PATTERNS)))
+# Plain substrings (case-sensitive, like the hrefs they are matched against)
+_SOCIAL_LITERALS = {
+    'linkedin_company': 'linkedin.com/company/',
+    'twitter': 'twitter.com/',
+    'facebook': 'facebook.com/',
+    'youtube': 'youtube.com/'
+}
+_ADDR_LABEL_RE = re.compile(r'address', re.IGNORECASE | re.ASCII)
+_ADDR_STOP_KEYWORDS = ('tel', 'phone', 'email', 'fax', 'kvk', 'vat')
+# Social media / LinkedIn domains (and their subdomains) whose pages we never browse
+_SKIP_DOMAINS_RE = re.compile(r'(?:^|\.)(?:linkedin|facebook|twitter|instagram|youtube|tiktok)\.com$')
+# Key pages and the href/link-text keywords that identify them
+_KEY_PAGE_KEYWORDS = (
+    # Contact page - expanded keywords
+    ('contact', ('contact', 'get-in-touch', 'reach-us', 'kontakt', 'contacteer',
+                 'contact-us', 'contactgegevens', 'locations', 'offices', 'address')),
+    ('about', ('about', 'who-we-are', 'company')),
+    ('team', ('team', 'people', 'leadership', 'our-team', 'staff', 'our-people',
+              'client-services', 'services')),
+)
+_ADDR_CLASS_RE = re.compile(r'address|location|contact')
+_TEAM_CLASS_RE = re.compile(r'team|staff|member|people|leadership|about', re.I)
+_ADDR_TAGS = frozenset(['address', 'div'])
+_TEAM_TAGS = frozenset(['div', 'section', 'article'])
+_HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b', 'p'])
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """The charset from the Content-Type header, if the server sent one"""
+    content_type = response.headers.get('Content-Type', '').lower()
+    return response.encoding if 'charset=' in content_type else None
+
+
+def _parse_html(content: bytes, encoding: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse a fetched page with the C-backed lxml parser (html.parser if lxml is missing)
+    
+    The raw bytes are parsed so the declared charset is honoured without
+    requests' own encoding detection; an HTTP header charset (encoding) takes precedence.
+    """
+    try:
+        return BeautifulSoup(content, 'lxml', from_encoding=encoding)
+    except FeatureNotFound:
+        return BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+
+
+def _find_links(soup: BeautifulSoup) -> List[Tag]:
+    """
+    Every <a href> in the soup, in document order
+    
+    Same as soup.find_all('a', href=True), but matching on the tag name alone and
+    checking the attribute in Python is several times faster than BeautifulSoup's
+    attribute matcher (and than soupsieve's soup.select('a[href]')).
+    """
+    return [link for link in soup.find_all('a') if 'href' in link.attrs]
+
+
+class _CachedLink:
+    """
+    An <a href> from the page cache: just its href and text
+    
+    Supports the part of the Tag API the link consumers use (get, ['href'],
+    get_text), so cached pages don't have to keep or re-parse their HTML.
+    """
+    
+    __slots__ = ('attrs', '_text')
+    
+    def __init__(self, href: str, text: str):
+        self.attrs = {'href': href}
+        self._text = text
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.attrs.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.attrs[key]
+    
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        return self._text.strip() if strip else self._text
+
+
+def _find_tags(root: Tag, names: FrozenSet[str], class_re: Optional[re.Pattern] = None) -> List[Tag]:
+    """
+    Tags under root named one of names (and with a class matching class_re), in document order
+    
+    Same result as root.find_all(list(names), class_=class_re): the class regex is
+    searched in the space-joined class list. A plain walk over root.descendants
+    skips BeautifulSoup's generic matcher, which is over 20x slower here.
+    """
+    tags = []
+    for element in root.descendants:
+        if element.name not in names:
+            continue
+        if class_re is not None:
+            classes = element.get('class')
+            if not classes or not class_re.search(classes if isinstance(classes, str) else ' '.join(classes)):
+                continue
+        tags.append(element)
+    return tags
+
+
+def _add_name(names: Dict[str, str], candidate: str) -> None:
+    """
+    Clean up a contact name candidate and add it to names (keyed by lower case)
+    
+    False positives, names of 3 characters or less and repeats are dropped.
+    """
+    # Collapse whitespace runs and trim (str.split() splits on exactly what \s matches)
+    name = ' '.join(candidate.split())
+    if len(name) <= 3:
+        return
+    name_lower = name.lower()
+    if not _NAME_SKIP_RE.search(name_lower):
+        names.setdefault(name_lower, name)
+
+
+def _cache_key(kind: str, *parts: str) -> str:
+    """Cache key for a URL / lookup (hashed: URLs can exceed backend key limits)"""
+    digest = hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+    return f"web_browser:{kind}:{digest}"
+
 
 class WebBrowserService:
     """
@@ -34,8 +214,55 @@ class WebBrowserService:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        # Retry transient error statuses briefly; after the last attempt the response
+        # is returned as-is so raise_for_status() still reports it. Retry-After is
+        # ignored so a rate-limited site can't stall a fetch for minutes, and
+        # connect errors / read timeouts are not retried so a dead or hanging host
+        # costs one timeout, not three
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=2,
+                connect=0,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=['GET', 'HEAD'],
+                raise_on_status=False,
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.timeout = 10  # seconds
         self.max_pages_per_site = 10  # Increased to find more contact info
+        
+        # Thread pool for fetching a site's pages concurrently, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Long-lived thread pool shared by all page fetches in this service"""
+        if self._executor is None:
+            # Locked so concurrent first callers can't each build (and leak) a pool
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=MAX_CONCURRENT_PAGES,
+                        thread_name_prefix="web-browser"
+                    )
+                    atexit.register(self._executor.shutdown, wait=False)
+        return self._executor
+    
+    def close(self):
+        """Release pooled connections and the fetch thread pool"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.session.close()
     
     def search_company_info(self, company_name: str, location: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -48,7 +275,10 @@ class WebBrowserService:
         Returns:
             Dict with website, contact_page, about_page, team_page, emails, phones, social_links
         """
-        logger.info(f"Searching web for: {company_name}" + (f" (location: {location})" if location else ""))
+        if location:
+            logger.info("Searching web for: %s (location: %s)", company_name, location)
+        else:
+            logger.info("Searching web for: %s", company_name)
         
         result = {
             'company_name': company_name,
@@ -64,111 +294,102 @@ class WebBrowserService:
             'description': None,
             'search_method': 'web_browser'
         }
+        # Values found so far, deduplicated as they come in (dicts keep first-seen order)
+        emails, phones, addresses, contact_names = {}, {}, {}, {}
+        # Browsed page data by role (homepage, contact, about, team), for the contact fan-out
+        page_results: Dict[str, Dict[str, Any]] = {}
         
         try:
             # Step 1: Try to find company website
             website = self._find_company_website(company_name, location=location)
             if not website:
-                logger.warning(f"Could not find website for {company_name}")
+                logger.warning("Could not find website for %s", company_name)
                 return result
             
             result['website'] = website
-            logger.info(f"Found website: {website}")
+            logger.info("Found website: %s", website)
             
             # Step 2: Browse the homepage
             homepage_data = self._browse_page(website)
             if homepage_data:
-                result['emails'].extend(homepage_data.get('emails', []))
-                result['phones'].extend(homepage_data.get('phones', []))
-                result['addresses'].extend(homepage_data.get('addresses', []))
+                page_results['homepage'] = homepage_data
+                emails.update(dict.fromkeys(homepage_data.get('emails', [])))
+                phones.update(dict.fromkeys(homepage_data.get('phones', [])))
+                addresses.update(dict.fromkeys(homepage_data.get('addresses', [])))
                 result['description'] = homepage_data.get('description')
             
             # Step 3: Find and browse key pages
-            key_pages = self._find_key_pages(website, homepage_data.get('soup'))
-            logger.info(f"Found {len(key_pages)} key pages: {list(key_pages.keys())}")
+            key_pages = self._find_key_pages(website, homepage_data.get('soup'), homepage_data.get('links'))
+            logger.info("Found %s key pages: %s", len(key_pages), list(key_pages.keys()))
+            
+            # Common contact page URLs to try when no contact link was found
+            common_contact_urls = [] if key_pages.get('contact') else [
+                f"{website.rstrip('/')}/contact",
+                f"{website.rstrip('/')}/contact-us",
+                f"{website.rstrip('/')}/contactus",
+                f"{website.rstrip('/')}/get-in-touch",
+                f"{website.rstrip('/')}/about/contact",
+            ]
+            
+            # Fetch every key page at once; the requests are independent,
+            # so the crawl takes about as long as the slowest page
+            pages = self._browse_pages(
+                [key_pages[page] for page in ('contact', 'about', 'team') if key_pages.get(page)]
+            )
             
             # Browse contact page
             if key_pages.get('contact'):
-                logger.info(f"Browsing contact page: {key_pages['contact']}")
+                logger.info("Browsing contact page: %s", key_pages['contact'])
                 result['contact_page'] = key_pages['contact']
-                contact_data = self._browse_page(key_pages['contact'])
+                contact_data = pages[key_pages['contact']]
                 if contact_data:
-                    logger.info(f"Contact page data: {len(contact_data.get('emails', []))} emails, {len(contact_data.get('phones', []))} phones, {len(contact_data.get('addresses', []))} addresses")
-                    result['emails'].extend(contact_data.get('emails', []))
-                    result['phones'].extend(contact_data.get('phones', []))
-                    result['addresses'].extend(contact_data.get('addresses', []))
-                    result['contact_names'].extend(contact_data.get('names', []))
+                    page_results['contact'] = contact_data
+                    logger.info("Contact page data: %s emails, %s phones, %s addresses", len(contact_data.get('emails', [])), len(contact_data.get('phones', [])), len(contact_data.get('addresses', [])))
+                    emails.update(dict.fromkeys(contact_data.get('emails', [])))
+                    phones.update(dict.fromkeys(contact_data.get('phones', [])))
+                    addresses.update(dict.fromkeys(contact_data.get('addresses', [])))
+                    contact_names.update(dict.fromkeys(contact_data.get('names', [])))
             else:
                 logger.warning("No contact page found - trying common contact URLs")
-                # Try common contact page URLs
-                common_contact_urls = [
-                    f"{website.rstrip('/')}/contact",
-                    f"{website.rstrip('/')}/contact-us",
-                    f"{website.rstrip('/')}/contactus",
-                    f"{website.rstrip('/')}/get-in-touch",
-                    f"{website.rstrip('/')}/about/contact",
-                ]
-                
-                for contact_url in common_contact_urls:
-                    try:
-                        logger.info(f"Trying contact URL: {contact_url}")
-                        contact_data = self._browse_page(contact_url)
-                        if contact_data and (contact_data.get('emails') or contact_data.get('phones') or contact_data.get('addresses')):
-                            logger.info(f"[OK] Found contact info at: {contact_url}")
-                            result['contact_page'] = contact_url
-                            result['emails'].extend(contact_data.get('emails', []))
-                            result['phones'].extend(contact_data.get('phones', []))
-                            result['addresses'].extend(contact_data.get('addresses', []))
-                            result['contact_names'].extend(contact_data.get('names', []))
-                            break  # Found contact info, stop trying
-                    except Exception as e:
-                        logger.debug(f"Failed to browse {contact_url}: {str(e)}")
-                        continue
+                # Take the first common contact URL (in priority order) with contact info
+                found = self._first_contact_page(common_contact_urls)
+                if found:
+                    contact_url, contact_data = found
+                    logger.info("[OK] Found contact info at: %s", contact_url)
+                    result['contact_page'] = contact_url
+                    emails.update(dict.fromkeys(contact_data.get('emails', [])))
+                    phones.update(dict.fromkeys(contact_data.get('phones', [])))
+                    addresses.update(dict.fromkeys(contact_data.get('addresses', [])))
+                    contact_names.update(dict.fromkeys(contact_data.get('names', [])))
             
             # Browse about page
             if key_pages.get('about'):
                 result['about_page'] = key_pages['about']
-                about_data = self._browse_page(key_pages['about'])
+                about_data = pages[key_pages['about']]
                 if about_data:
-                    result['contact_names'].extend(about_data.get('names', []))
-                    result['addresses'].extend(about_data.get('addresses', []))
+                    page_results['about'] = about_data
+                    contact_names.update(dict.fromkeys(about_data.get('names', [])))
+                    addresses.update(dict.fromkeys(about_data.get('addresses', [])))
             
             # Browse team page
             if key_pages.get('team'):
                 result['team_page'] = key_pages['team']
-                team_data = self._browse_page(key_pages['team'])
+                team_data = pages[key_pages['team']]
                 if team_data:
-                    result['contact_names'].extend(team_data.get('names', []))
-                    result['emails'].extend(team_data.get('emails', []))
+                    page_results['team'] = team_data
+                    contact_names.update(dict.fromkeys(team_data.get('names', [])))
+                    emails.update(dict.fromkeys(team_data.get('emails', [])))
             
             # Step 4: Find social media links
-            result['social_links'] = self._extract_social_links(homepage_data.get('soup'))
-            
-            # Deduplicate results
-            result['emails'] = list(set(result['emails']))
-            result['phones'] = list(set(result['phones']))
-            result['addresses'] = list(set(result['addresses']))
-            result['contact_names'] = list(set(result['contact_names']))
+            result['social_links'] = self._extract_social_links(homepage_data.get('soup'), homepage_data.get('links'))
             
             # Step 5: Extract LinkedIn URLs from all visited pages
-            # Collect contacts from all pages we've browsed
-            all_contacts = []
-            
-            # Homepage contacts
-            if homepage_data and homepage_data.get('contacts'):
-                all_contacts.extend(homepage_data.get('contacts', []))
-            
-            # Contact page contacts (already browsed above)
-            if key_pages.get('contact') and 'contact_data' in locals() and contact_data and contact_data.get('contacts'):
-                all_contacts.extend(contact_data.get('contacts', []))
-            
-            # About page contacts (already browsed above)
-            if key_pages.get('about') and 'about_data' in locals() and about_data and about_data.get('contacts'):
-                all_contacts.extend(about_data.get('contacts', []))
-            
-            # Team page contacts (already browsed above)
-            if key_pages.get('team') and 'team_data' in locals() and team_data and team_data.get('contacts'):
-                all_contacts.extend(team_data.get('contacts', []))
+            # Collect contacts from all pages we've browsed (homepage, contact, about, team)
+            all_contacts = [
+                contact
+                for page_data in page_results.values()
+                for contact in page_data.get('contacts') or ()
+            ]
             
             # Build LinkedIn URLs list
             linkedin_urls = []
@@ -184,10 +405,15 @@ class WebBrowserService:
             result['linkedin_urls'] = linkedin_urls
             result['all_contacts'] = all_contacts  # Include full contact objects
             
-            logger.info(f"Web search complete: {len(result['emails'])} emails, {len(result['contact_names'])} names, {len(linkedin_urls)} LinkedIn URLs found")
+            logger.info("Web search complete: %s emails, %s names, %s LinkedIn URLs found", len(emails), len(contact_names), len(linkedin_urls))
             
         except Exception as e:
-            logger.error(f"Web search failed for {company_name}: {str(e)}")
+            logger.error("Web search failed for %s: %s", company_name, e)
+        finally:
+            result['emails'] = list(emails)
+            result['phones'] = list(phones)
+            result['addresses'] = list(addresses)
+            result['contact_names'] = list(contact_names)
         
         return result
     
@@ -196,10 +422,23 @@ class WebBrowserService:
         Find the company website using web search
         Now uses DuckDuckGo search instead of just guessing
         
+        Found websites are cached per (company name, location); misses are not,
+        so a transient search failure is retried next time.
+        
         Args:
             company_name: Company name
             location: Optional location to help narrow search
         """
+        cache_key = _cache_key('website', company_name.lower().strip(), (location or '').lower().strip())
+        website = cache.get(cache_key)
+        if website is None:
+            website = self._search_company_website(company_name, location)
+            if website:
+                cache.set(cache_key, website, WEBSITE_CACHE_TTL)
+        return website
+    
+    def _search_company_website(self, company_name: str, location: Optional[str] = None) -> Optional[str]:
+        """Uncached implementation of _find_company_website"""
         try:
             # Use web search service for better results
             from apps.dashboard.services.web_search_service import get_web_search_service
@@ -207,7 +446,7 @@ class WebBrowserService:
             website = search_service.search_company_website(company_name, location=location)
             return website
         except Exception as e:
-            logger.error(f"Web search failed, falling back to domain guessing: {str(e)}")
+            logger.error("Web search failed, falling back to domain guessing: %s", e)
             
             # Fallback to simple domain patterns
             company_slug = company_name.lower().replace(' ', '').replace('-', '').replace('_', '')
@@ -221,29 +460,102 @@ class WebBrowserService:
                 f"https://{company_slug}.co",
             ]
             
-            for url in potential_domains:
-                try:
-                    response = self.session.head(url, timeout=5, allow_redirects=True)
-                    if response.status_code == 200:
-                        return response.url  # Return final URL after redirects
-                except:
-                    continue
-            
+            # Probe all candidates at once but keep the list's priority order:
+            # worst case is one probe timeout instead of one per domain
+            probe_pool = ThreadPoolExecutor(max_workers=len(potential_domains), thread_name_prefix="web-browser-probe")
+            try:
+                futures = [probe_pool.submit(self._probe_url, url) for url in potential_domains]
+                for future in futures:
+                    final_url = future.result()
+                    if final_url:
+                        return final_url
+                return None
+            finally:
+                probe_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _probe_url(self, url: str) -> Optional[str]:
+        """HEAD a candidate URL; the final URL after redirects if it answers 200"""
+        try:
+            response = self.session.head(url, timeout=5, allow_redirects=True)
+            if response.status_code == 200:
+                return response.url
+        except Exception:
+            pass
+        return None
+    
+    def _browse_pages(self, urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Browse several pages concurrently
+        
+        Returns _browse_page's result (None on failure) keyed by URL; a URL listed
+        more than once (e.g. the same page linked as about and team) is fetched once.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        return dict(zip(unique_urls, self.executor.map(self._browse_page, unique_urls)))
+    
+    def _first_contact_page(self, urls: List[str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        The first of urls (in order) whose page has emails, phones or addresses, with its data
+        
+        All candidates are downloaded concurrently, but the parse and (AI) extraction
+        only run in order up to the first hit; pages that failed to load - usually
+        most of these guesses - are never parsed at all.
+        """
+        responses = dict(zip(urls, self.executor.map(self._fetch_page, urls)))
+        for url in urls:
+            logger.info("Trying contact URL: %s", url)
+            if responses[url] is None and cache.get(_cache_key('page', url)) is None:
+                continue  # Failed to load
+            data = self._browse_page(url, responses[url])
+            if data and (data.get('emails') or data.get('phones') or data.get('addresses')):
+                return url, data
+        return None
+    
+    def _fetch_page(self, url: str) -> Optional[requests.Response]:
+        """Download a page for _browse_page; None if it failed or is already in the page cache"""
+        if cache.get(_cache_key('page', url)) is not None:
+            return None
+        try:
+            logger.debug("Fetching: %s", url)
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response
+        except Exception as e:
+            logger.warning("Failed to browse %s: %s", url, e)
             return None
     
-    def _browse_page(self, url: str) -> Optional[Dict[str, Any]]:
+    def _browse_page(self, url: str, response: Optional[requests.Response] = None) -> Optional[Dict[str, Any]]:
         """
         Browse a page and extract useful information
         Uses AI-powered extraction for better accuracy
+        
+        Successful results are cached for PAGE_CACHE_TTL as the extracted fields
+        plus each link's href and text; the HTML itself is not kept. A hit has
+        'soup' None and 'links' rebuilt as _CachedLink objects, which is all the
+        link consumers (_find_key_pages, _extract_social_links) need.
+        
+        response: the page, if already downloaded (see _fetch_page)
         """
+        cache_key = _cache_key('page', url)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Browsing (cached): %s", url)
+            links = [_CachedLink(href, text) for href, text in cached['links']]
+            return {**cached['data'], 'soup': None, 'links': links}
+        
         try:
-            logger.debug(f"Browsing: {url}")
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            if response is None:
+                logger.debug("Browsing: %s", url)
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            encoding = _declared_encoding(response)
+            soup = _parse_html(response.content, encoding)
+            # Every <a href> on the page, collected once for all the link-based extractors
+            links = _find_links(soup)
             
-            # Use AI to extract contacts from the page text
+            # Use AI to extract contacts from the page text; the same text is
+            # handed to every extractor below instead of re-walking the DOM
             page_text = soup.get_text()
             
             try:
@@ -251,7 +563,7 @@ class WebBrowserService:
                 ai_extractor = get_ai_contact_extractor()
                 ai_results = ai_extractor.extract_contacts_from_text(page_text, url, soup)
                 
-                logger.debug(f"AI extraction results: {ai_results}")
+                logger.debug("AI extraction results: %s", ai_results)
                 
                 # Extract data from AI results
                 contacts = ai_results.get('contacts', [])
@@ -263,46 +575,50 @@ class WebBrowserService:
                 # Combine emails from AI and traditional extraction
                 ai_emails = ai_results.get('general_emails', [])
                 ai_emails.extend([c['email'] for c in contacts if c.get('email')])
-                traditional_emails = self._extract_emails(soup)
-                all_emails = list(set(ai_emails + traditional_emails))
+                traditional_emails = self._extract_emails(soup, page_text, links)
+                all_emails = list(dict.fromkeys(ai_emails + traditional_emails))
                 
-                logger.debug(f"Emails - AI: {len(ai_emails)}, Traditional: {len(traditional_emails)}, Total: {len(all_emails)}")
+                logger.debug("Emails - AI: %s, Traditional: %s, Total: %s", len(ai_emails), len(traditional_emails), len(all_emails))
                 
                 # Same for phones
                 ai_phones = ai_results.get('general_phones', [])
-                traditional_phones = self._extract_phones(soup)
-                all_phones = list(set(ai_phones + traditional_phones))
+                traditional_phones = self._extract_phones(soup, page_text, links)
+                all_phones = list(dict.fromkeys(ai_phones + traditional_phones))
                 
-                logger.debug(f"Phones - AI: {len(ai_phones)}, Traditional: {len(traditional_phones)}, Total: {len(all_phones)}")
+                logger.debug("Phones - AI: %s, Traditional: %s, Total: %s", len(ai_phones), len(traditional_phones), len(all_phones))
                 
                 # Extract addresses
-                addresses = self._extract_addresses(soup)
+                addresses = self._extract_addresses(soup, page_text)
                 
-                logger.debug(f"Addresses extracted: {len(addresses)}")
+                logger.debug("Addresses extracted: %s", len(addresses))
                 if addresses:
-                    logger.info(f"Found addresses: {addresses[:3]}")  # Log first 3
-                
-                # Log a sample of the page text for debugging (look for "Tel" and addresses)
-                if 'tel' in page_text.lower() or 'phone' in page_text.lower():
-                    # Find the section with phone numbers
-                    tel_index = page_text.lower().find('tel')
-                    if tel_index > 0:
-                        sample_start = max(0, tel_index - 100)
-                        sample_end = min(len(page_text), tel_index + 200)
-                        logger.info(f"Page contains 'Tel' - sample: {page_text[sample_start:sample_end]}")
+                    logger.debug("Found addresses: %s", addresses[:3])  # Log first 3
                 
-                if 'utrecht' in page_text.lower() or 'netherlands' in page_text.lower():
-                    # Find Netherlands section
-                    nl_index = page_text.lower().find('netherlands')
-                    if nl_index > 0:
-                        sample_start = max(0, nl_index - 200)
-                        sample_end = min(len(page_text), nl_index + 100)
-                        logger.info(f"Page contains 'Netherlands' - sample: {page_text[sample_start:sample_end]}")
+                # Log a sample of the page text for debugging (look for "Tel" and addresses);
+                # lowercasing and slicing the whole page is only worth it when someone reads it
+                if logger.isEnabledFor(logging.DEBUG):
+                    page_text_lower = page_text.lower()
+                    if 'tel' in page_text_lower or 'phone' in page_text_lower:
+                        # Find the section with phone numbers
+                        tel_index = page_text_lower.find('tel')
+                        if tel_index > 0:
+                            sample_start = max(0, tel_index - 100)
+                            sample_end = min(len(page_text), tel_index + 200)
+                            logger.debug("Page contains 'Tel' - sample: %s", page_text[sample_start:sample_end])
+                    
+                    if 'utrecht' in page_text_lower or 'netherlands' in page_text_lower:
+                        # Find Netherlands section
+                        nl_index = page_text_lower.find('netherlands')
+                        if nl_index > 0:
+                            sample_start = max(0, nl_index - 200)
+                            sample_end = min(len(page_text), nl_index + 100)
+                            logger.debug("Page contains 'Netherlands' - sample: %s", page_text[sample_start:sample_end])
                 
                 # Store full contact objects
                 data = {
                     'url': url,
                     'soup': soup,
+                    'links': links,
                     'emails': all_emails,
                     'phones': all_phones,
                     'addresses': addresses,
@@ -311,20 +627,20 @@ class WebBrowserService:
                     'description': self._extract_description(soup)
                 }
                 
-                logger.info(f"Page extraction complete: {len(all_emails)} emails, {len(all_phones)} phones, {len(addresses)} addresses, {len(names_with_titles)} names")
+                logger.info("Page extraction complete: %s emails, %s phones, %s addresses, %s names", len(all_emails), len(all_phones), len(addresses), len(names_with_titles))
                 
             except Exception as e:
-                logger.warning(f"AI extraction failed, using traditional methods: {str(e)}")
-                import traceback
-                logger.debug(f"AI extraction error traceback: {traceback.format_exc()}")
+                logger.warning("AI extraction failed, using traditional methods: %s", e)
+                logger.debug("AI extraction error traceback", exc_info=True)
                 # Fallback to traditional extraction
                 data = {
                     'url': url,
                     'soup': soup,
-                    'emails': self._extract_emails(soup),
-                    'phones': self._extract_phones(soup),
-                    'addresses': self._extract_addresses(soup),
-                    'names': self._extract_names(soup),
+                    'links': links,
+                    'emails': self._extract_emails(soup, page_text, links),
+                    'phones': self._extract_phones(soup, page_text, links),
+                    'addresses': self._extract_addresses(soup, page_text),
+                    'names': self._extract_names(soup, page_text),
                     'contacts': [],
                     'description': self._extract_description(soup)
                 }
@@ -332,60 +648,64 @@ class WebBrowserService:
             # Special handling for LinkedIn pages
             if 'linkedin.com' in url.lower():
                 # Extract company LinkedIn profile URL (from job pages)
-                company_linkedin_url = self._extract_company_linkedin_url(soup)
+                company_linkedin_url = self._extract_company_linkedin_url(soup, links)
                 if company_linkedin_url:
                     data['company_linkedin_url'] = company_linkedin_url
-                    logger.info(f"Extracted company LinkedIn URL: {company_linkedin_url}")
+                    logger.info("Extracted company LinkedIn URL: %s", company_linkedin_url)
                 
                 # Extract company website URL (from company pages)
-                company_website = self._extract_company_website_from_linkedin(soup)
+                company_website = self._extract_company_website_from_linkedin(soup, links)
                 if company_website:
                     data['company_website'] = company_website
-                    logger.info(f"Extracted company website from LinkedIn: {company_website}")
+                    logger.info("Extracted company website from LinkedIn: %s", company_website)
+            
+            cache.set(cache_key, {
+                'links': [(link['href'], link.get_text()) for link in links],
+                'data': {key: value for key, value in data.items() if key not in ('soup', 'links')}
+            }, PAGE_CACHE_TTL)
             
             return data
             
         except Exception as e:
-            logger.warning(f"Failed to browse {url}: {str(e)}")
+            logger.warning("Failed to browse %s: %s", url, e)
             return None
     
-    def _extract_company_linkedin_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_company_linkedin_url(self, soup: BeautifulSoup, links: Optional[List[Tag]] = None) -> Optional[str]:
         """
         Extract LinkedIn company profile URL from job posting pages
         Job pages have links to company pages like: linkedin.com/company/pm-group_165501
         """
         try:
-            for link in soup.find_all('a', href=True):
+            for link in (_find_links(soup) if links is None else links):
                 href = link.get('href')
                 
                 # Look for company profile URLs
                 if href and '/company/' in href and 'linkedin.com' in href:
                     # Clean up tracking parameters
-                    from urllib.parse import urlparse, urlunparse
-                    parsed = urlparse(href)
+                    parsed = urlsplit(href)
                     # Remove query parameters (tracking)
-                    clean_url = urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', '', ''))
+                    clean_url = urlunsplit((parsed.scheme, parsed.netloc, parsed.path, '', ''))
                     
                     # Make sure it starts with http
                     if not clean_url.startswith('http'):
                         clean_url = 'https://' + clean_url.lstrip('/')
                     
-                    logger.debug(f"Found company LinkedIn URL: {clean_url}")
+                    logger.debug("Found company LinkedIn URL: %s", clean_url)
                     return clean_url
         
         except Exception as e:
-            logger.warning(f"Failed to extract company LinkedIn URL: {e}")
+            logger.warning("Failed to extract company LinkedIn URL: %s", e)
         
         return None
     
-    def _extract_company_website_from_linkedin(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_company_website_from_linkedin(self, soup: BeautifulSoup, links: Optional[List[Tag]] = None) -> Optional[str]:
         """
         Extract company website URL from LinkedIn company/job pages
         LinkedIn has "Visit website" or "Learn more" buttons with company URLs
         """
         try:
             # Look for links with "Visit website" or "Learn more" text
-            for link in soup.find_all('a', href=True):
+            for link in (_find_links(soup) if links is None else links):
                 text = link.get_text(strip=True).lower()
                 
                 # Check for typical button text
@@ -396,7 +716,7 @@ class WebBrowserService:
                     if href and 'linkedin.com' not in href.lower():
                         # Clean up URL
                         if href.startswith('http'):
-                            logger.debug(f"Found company website link via '{text}': {href}")
+                            logger.debug("Found company website link via '%s': %s", text, href)
                             return href
             
             # Alternative: Look for external links in specific sections
@@ -406,57 +726,58 @@ class WebBrowserService:
                 href = link.get('href')
                 if href and href.startswith('http') and 'linkedin.com' not in href.lower():
                     # Verify it looks like a company website
-                    from urllib.parse import urlparse
-                    parsed = urlparse(href)
+                    parsed = urlsplit(href)
                     if parsed.netloc and not any(skip in parsed.netloc.lower() for skip in ['facebook', 'twitter', 'instagram']):
-                        logger.debug(f"Found company website via external link: {href}")
+                        logger.debug("Found company website via external link: %s", href)
                         return href
             
         except Exception as e:
-            logger.warning(f"Failed to extract company website from LinkedIn: {e}")
+            logger.warning("Failed to extract company website from LinkedIn: %s", e)
         
         return None
     
-    def _find_key_pages(self, base_url: str, soup: Optional[BeautifulSoup]) -> Dict[str, str]:
+    def _find_key_pages(self, base_url: str, soup: Optional[BeautifulSoup],
+                        links: Optional[List[Tag]] = None) -> Dict[str, str]:
         """
         Find important pages like Contact, About, Team
+        
+        links: the page's <a href> tags, if already collected (see _browse_page);
+        cached pages only have these, with soup None
         """
         key_pages = {}
         
-        if not soup:
+        if not soup and links is None:
             return key_pages
         
         # Find all links
-        links = soup.find_all('a', href=True)
+        if links is None:
+            links = _find_links(soup)
         
         for link in links:
             href = link.get('href', '').lower()
             text = link.get_text().lower().strip()
             
-            # Make absolute URL
+            # Which of the still-missing pages this link looks like
+            matched_pages = [
+                page for page, keywords in _KEY_PAGE_KEYWORDS
+                if page not in key_pages and any(keyword in href or keyword in text for keyword in keywords)
+            ]
+            if not matched_pages:
+                continue
+            
+            # Make absolute URL (only for links we'd actually keep)
             full_url = urljoin(base_url, link['href'])
             
             # Check if this is a domain we should skip (LinkedIn, etc.)
             if self._should_skip_url(full_url):
                 continue
             
-            # Contact page - expanded keywords
-            if not key_pages.get('contact'):
-                if any(keyword in href or keyword in text for keyword in [
-                    'contact', 'get-in-touch', 'reach-us', 'kontakt', 'contacteer', 
-                    'contact-us', 'contactgegevens', 'locations', 'offices', 'address'
-                ]):
-                    key_pages['contact'] = full_url
-            
-            # About page
-            if not key_pages.get('about'):
-                if any(keyword in href or keyword in text for keyword in ['about', 'who-we-are', 'company']):
-                    key_pages['about'] = full_url
+            for page in matched_pages:
+                key_pages[page] = full_url
             
-            # Team page
-            if not key_pages.get('team'):
-                if any(keyword in href or keyword in text for keyword in ['team', 'people', 'leadership', 'our-team', 'staff', 'our-people', 'client-services', 'services']):
-                    key_pages['team'] = full_url
+            # Contact, about and team all found: the remaining links can't change anything
+            if len(key_pages) == len(_KEY_PAGE_KEYWORDS):
+                break
         
         return key_pages
     
@@ -464,34 +785,27 @@ class WebBrowserService:
         """
         Check if we should skip this URL (e.g., LinkedIn, social media)
         """
-        skip_domains = [
-            'linkedin.com',
-            'facebook.com',
-            'twitter.com',
-            'instagram.com',
-            'youtube.com',
-            'tiktok.com'
-        ]
-        
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        
-        return any(skip in domain for skip in skip_domains)
-    
-    def _extract_emails(self, soup: BeautifulSoup) -> List[str]:
-        """Extract email addresses from page"""
-        emails = []
+        # hostname is lower-cased and free of port/credentials
+        domain = urlsplit(url).hostname or ''
         
-        # Pattern for email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        return _SKIP_DOMAINS_RE.search(domain) is not None
+    
+    def _extract_emails(self, soup: BeautifulSoup, text: Optional[str] = None,
+                        links: Optional[List[Tag]] = None) -> List[str]:
+        """Extract email addresses from page (text/links: the page's text and <a href> tags, if already computed)"""
+        emails = []
         
         # Search in text content
-        text = soup.get_text()
-        found_emails = re.findall(email_pattern, text)
+        if text is None:
+            text = soup.get_text()
+        found_emails = _EMAIL_RE.findall(text)
         emails.extend(found_emails)
         
         # Search in mailto links
-        mailto_links = soup.find_all('a', href=re.compile(r'^mailto:'))
+        if links is None:
+            mailto_links = soup.find_all('a', href=_MAILTO_RE)
+        else:
+            mailto_links = [link for link in links if _MAILTO_RE.match(link['href'])]
         for link in mailto_links:
             email = link['href'].replace('mailto:', '').split('?')[0]
             emails.append(email)
@@ -500,45 +814,36 @@ class WebBrowserService:
         generic_patterns = ['example.com', 'domain.com', 'email.com', 'test@']
         emails = [e for e in emails if not any(pattern in e.lower() for pattern in generic_patterns)]
         
-        return list(set(emails))
+        return list(dict.fromkeys(emails))
     
-    def _extract_phones(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_phones(self, soup: BeautifulSoup, text: Optional[str] = None,
+                        links: Optional[List[Tag]] = None) -> List[str]:
         """Extract phone numbers from page - supports European and US formats"""
         phones = []
         
-        text = soup.get_text()
+        if text is None:
+            text = soup.get_text()
         
         # Normalize text: replace multiple spaces/newlines with single space
         text_normalized = ' '.join(text.split())
         
-        # Multiple phone patterns for different formats
-        phone_patterns = [
-            r'Tel\.?\s*\+\d{1,3}[\s\d]+',  # "Tel. +31 30 2 123 123" or "Tel +45 7020 2728"
-            r'\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,4}',  # International: +31 30 2 123 123
-            r'\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,4}',  # +1 (555) 123-4567
-            r'\d{2,4}[\s.-]\d{1,4}[\s.-]\d{1,4}[\s.-]\d{1,4}',  # European: 030 123 456 78
-            r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # US: (555) 123-4567
-        ]
-        
-        # Try on normalized text first
-        for pattern in phone_patterns:
-            found = re.findall(pattern, text_normalized)
-            phones.extend(found)
-        
-        # Also try on original text in case normalization broke something
-        for pattern in phone_patterns:
-            found = re.findall(pattern, text)
-            phones.extend(found)
+        # One scan for all phone formats (see _PHONE_PATTERNS). Normalization only
+        # collapses whitespace runs, so scanning the original text as well found
+        # nothing new once the matches were cleaned below
+        phones.extend(_PHONE_RE.findall(text_normalized))
         
         # Search in tel links
-        tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
+        if links is None:
+            tel_links = soup.find_all('a', href=_TEL_RE)
+        else:
+            tel_links = [link for link in links if _TEL_RE.match(link['href'])]
         for link in tel_links:
             phone = link['href'].replace('tel:', '').strip()
             phones.append(phone)
         
         # Clean and deduplicate
         cleaned_phones = []
-        logger.info(f"Raw phones found before cleaning: {phones[:5]}")  # Log first 5
+        logger.debug("Raw phones found before cleaning: %s", phones[:5])  # Log first 5
         
         for phone in phones:
             # Clean "Tel." prefix if present
@@ -546,35 +851,50 @@ class WebBrowserService:
             # Remove extra whitespace
             phone = ' '.join(phone.split())
             # Only keep if it has enough digits (at least 7)
-            digits_only = re.sub(r'[^\d]', '', phone)
+            digits_only = _NON_DIGIT_RE.sub('', phone)
             if len(digits_only) >= 7:
                 cleaned_phones.append(phone)
         
-        logger.info(f"Cleaned phones: {cleaned_phones}")
-        return list(set(cleaned_phones))
+        logger.debug("Cleaned phones: %s", cleaned_phones)
+        return list(dict.fromkeys(cleaned_phones))
     
-    def _extract_addresses(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_addresses(self, soup: BeautifulSoup, text: Optional[str] = None) -> List[str]:
         """Extract physical addresses from page"""
         addresses = []
         
-        text = soup.get_text()
+        if text is None:
+            text = soup.get_text()
         
         # Look for structured addresses in the text
         # Pattern 1: Multi-line address with "Address" label
         # Example: "Address\nUppsalalaan 15\n3584 CT Utrecht\nThe Netherlands"
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line = line.strip()
-            # Check if this line contains "Address" or "Visiting Address"
-            if 'address' in line.lower() and len(line) < 50:
+        # Jump straight to each "address" mention instead of splitting the whole page
+        # into lines; blocks may overlap (a "Postal address" label inside another block)
+        line_end = -1
+        for match in _ADDR_LABEL_RE.finditer(text):
+            if match.start() < line_end:
+                continue  # Another mention on a line already handled
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(text)
+            # A short label line such as "Address" or "Visiting Address"
+            if len(text[line_start:line_end].strip()) < 50:
                 # Collect next 3-4 lines as potential address
                 addr_lines = []
-                for j in range(i+1, min(i+5, len(lines))):
-                    next_line = lines[j].strip()
+                block_end = line_end
+                for _ in range(4):
+                    if block_end >= len(text):
+                        break
+                    next_start = block_end + 1
+                    block_end = text.find('\n', next_start)
+                    if block_end == -1:
+                        block_end = len(text)
+                    next_line = text[next_start:block_end].strip()
                     if next_line and len(next_line) < 100:
                         addr_lines.append(next_line)
                         # Stop if we hit a line that looks like end of address
-                        if any(keyword in next_line.lower() for keyword in ['tel', 'phone', 'email', 'fax', 'kvk', 'vat']):
+                        if any(keyword in next_line.lower() for keyword in _ADDR_STOP_KEYWORDS):
                             break
                 if len(addr_lines) >= 2:
                     # Join the address lines
@@ -583,12 +903,11 @@ class WebBrowserService:
         
         # Pattern 2: Dutch postal code pattern in text
         # "Street Number, 1234 AB City"
-        postal_pattern = r'([A-Z][a-zà-ÿ]+(?:\s+[A-Z][a-zà-ÿ]+)*\s+\d+[a-zA-Z]?\s*,?\s*\d{4}\s*[A-Z]{2}\s+[A-Z][a-zà-ÿ]+)'
-        found = re.findall(postal_pattern, text, re.MULTILINE)
+        found = _POSTAL_RE.findall(text)
         addresses.extend(found)
         
         # Look for address in structured HTML tags
-        for tag in soup.find_all(['address', 'div'], class_=re.compile(r'address|location|contact')):
+        for tag in _find_tags(soup, _ADDR_TAGS, _ADDR_CLASS_RE):
             addr_text = tag.get_text(separator=', ', strip=True)
             if len(addr_text) > 15 and len(addr_text) < 300:
                 addresses.append(addr_text)
@@ -599,144 +918,137 @@ class WebBrowserService:
             # Remove excessive whitespace
             addr = ' '.join(addr.split())
             # Must be substantial and contain numbers (street number or postal code)
-            if len(addr) > 15 and re.search(r'\d', addr):
+            if len(addr) > 15 and _DIGIT_RE.search(addr):
                 cleaned_addresses.append(addr)
         
-        return list(set(cleaned_addresses))
+        return list(dict.fromkeys(cleaned_addresses))
     
-    def _extract_names(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_names(self, soup: BeautifulSoup, text: Optional[str] = None) -> List[str]:
         """
         Extract potential contact names from page
         Looks for common patterns: "John Smith, CEO" etc.
+        
+        The strategies yield candidates lazily, so once MAX_NAMES names are kept the
+        rest of the page (page text split, JSON-LD parsing) is never looked at.
         """
-        names = []
+        # Cleaned names keyed by lower-case spelling, deduplicated as they are found
+        names: Dict[str, str] = {}
         
-        # Strategy 1: Look for team/leadership sections
-        team_sections = soup.find_all(['div', 'section', 'article'], class_=re.compile(r'team|staff|member|people|leadership|about', re.I))
+        candidates = itertools.chain(
+            self._team_section_names(soup),
+            self._title_line_names(soup, text),
+            self._json_ld_names(soup)
+        )
+        for candidate in candidates:
+            _add_name(names, candidate)
+            if len(names) >= MAX_NAMES:
+                break
+        
+        return list(names.values())
+    
+    def _team_section_names(self, soup: BeautifulSoup) -> Iterator[str]:
+        """Strategy 1: Look for team/leadership sections"""
+        team_sections = _find_tags(soup, _TEAM_TAGS, _TEAM_CLASS_RE)
         
         for section in team_sections:
             # Find headings that might be names
-            headings = section.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b', 'p'])
+            headings = _find_tags(section, _HEADING_TAGS)
             for heading in headings:
-                text = heading.get_text().strip()
+                heading_text = heading.get_text().strip()
                 # Check if it looks like a name (2-3 words, capitalized)
-                words = text.split()
+                words = heading_text.split()
                 if 2 <= len(words) <= 4 and all(w[0].isupper() for w in words if w and len(w) > 1):
                     # Filter out common non-name phrases
-                    skip_phrases = ['View Our', 'Meet The', 'Our Team', 'The Team', 'Contact Us', 'Get In Touch']
-                    if not any(skip in text for skip in skip_phrases):
-                        names.append(text)
-        
-        # Strategy 2: Look for text patterns like "Name\nTitle" or "Name, Title"
-        all_text = soup.get_text()
+                    if not _HEADING_SKIP_RE.search(heading_text):
+                        yield heading_text
+    
+    def _title_line_names(self, soup: BeautifulSoup, text: Optional[str] = None) -> Iterator[str]:
+        """Strategy 2: Look for a line with a name followed by a line with a job title"""
+        all_text = soup.get_text() if text is None else text
         
         # Pattern: Line with Name, next line with title (CEO, Director, etc.)
-        lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-        title_keywords = ['CEO', 'COO', 'CFO', 'CTO', 'Director', 'Manager', 'President', 'Vice President', 'VP', 'Head', 'Chief', 'Lead']
+        lines = [line for line in map(str.strip, all_text.split('\n')) if line]
         
-        for i in range(len(lines) - 1):
-            current_line = lines[i]
-            next_line = lines[i + 1]
-            
-            # Check if current line looks like a name
-            words = current_line.split()
-            if 2 <= len(words) <= 4:
-                # Check if next line contains a title
-                if any(keyword in next_line for keyword in title_keywords):
-                    # This is likely a name followed by a title
-                    if current_line not in names:
-                        names.append(current_line)
-        
-        # Strategy 3: Find structured data (JSON-LD, microdata)
-        # Look for Person schema
-        scripts = soup.find_all('script', type='application/ld+json')
+        for current_line, next_line in zip(lines, lines[1:]):
+            # Check if next line contains a title and current line looks like a name
+            if _TITLE_RE.search(next_line) and 2 <= len(current_line.split()) <= 4:
+                # This is likely a name followed by a title
+                yield current_line
+    
+    def _json_ld_names(self, soup: BeautifulSoup) -> Iterator[str]:
+        """Strategy 3: Find structured data (JSON-LD, microdata) - Person schema and Organization employees"""
+        scripts = [script for script in soup.find_all('script') if script.get('type') == 'application/ld+json']
         for script in scripts:
+            json_text = script.string
+            # Only Person/Organization objects are used: don't parse the (often large)
+            # breadcrumb, WebSite, Product... blocks that can't mention either
+            if not json_text or ('"Person"' not in json_text and '"Organization"' not in json_text):
+                continue
+            ld_names = []
             try:
-                import json
-                data = json.loads(script.string)
+                data = from_json(json_text)
                 if isinstance(data, dict):
                     if data.get('@type') == 'Person' and data.get('name'):
-                        names.append(data['name'])
+                        ld_names.append(data['name'])
                     elif data.get('@type') == 'Organization' and data.get('employee'):
-                        employees = data['employee'] if isinstance(data['employee'], list) else [data['employee']]
-                        for emp in employees:
+                        employees = data['employee']
+                        for emp in (employees if isinstance(employees, list) else (employees,)):
                             if isinstance(emp, dict) and emp.get('name'):
-                                names.append(emp['name'])
-            except:
-                pass
-        
-        # Deduplicate and clean
-        cleaned_names = []
-        seen = set()
-        
-        # Filter out common false positives
-        skip_patterns = [
-            'read more', 'learn more', 'click here', 'view', 'see more',
-            'the team', 'our team', 'meet', 'about us', 'contact',
-            'the leadership', 'leadership team', 'management team'
-        ]
-        
-        for name in names:
-            # Clean up the name
-            name = re.sub(r'\s+', ' ', name).strip()
-            
-            # Skip false positives
-            if any(skip in name.lower() for skip in skip_patterns):
-                continue
-            
-            # Skip if too short or already seen
-            if len(name) > 3 and name.lower() not in seen:
-                seen.add(name.lower())
-                cleaned_names.append(name)
-        
-        return cleaned_names[:30]  # Limit to 30 names
+                                ld_names.append(emp['name'])
+            except (ValueError, TypeError):
+                continue  # Empty or malformed JSON-LD
+            yield from ld_names
     
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract company description from meta tags or about text"""
         
+        # Find the first meta description and og:description in one walk, stopping
+        # as soon as the answer is known (usually inside <head>)
+        meta_desc = og_desc = None
+        for element in soup.descendants:
+            if element.name != 'meta':
+                continue
+            if meta_desc is None and element.get('name') == 'description':
+                meta_desc = element
+                if element.get('content'):
+                    break  # Takes precedence over og:description
+            if og_desc is None and element.get('property') == 'og:description':
+                og_desc = element
+            if meta_desc is not None and og_desc is not None:
+                break
+        
         # Try meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
         if meta_desc and meta_desc.get('content'):
             return meta_desc['content'].strip()
         
         # Try og:description
-        og_desc = soup.find('meta', attrs={'property': 'og:description'})
         if og_desc and og_desc.get('content'):
             return og_desc['content'].strip()
         
         return None
     
-    def _extract_social_links(self, soup: Optional[BeautifulSoup]) -> Dict[str, str]:
-        """Extract social media links (for reference, not scraping)"""
-        if not soup:
+    def _extract_social_links(self, soup: Optional[BeautifulSoup], links: Optional[List[Tag]] = None) -> Dict[str, str]:
+        """Extract social media links (for reference, not scraping; links as in _find_key_pages)"""
+        if not soup and links is None:
             return {}
         
         social = {}
         
-        social_patterns = {
-            'linkedin_company': r'linkedin\.com/company/',
-            'twitter': r'twitter\.com/',
-            'facebook': r'facebook\.com/',
-            'youtube': r'youtube\.com/'
-        }
-        
-        links = soup.find_all('a', href=True)
+        if links is None:
+            links = _find_links(soup)
         for link in links:
             href = link['href']
-            for platform, pattern in social_patterns.items():
-                if re.search(pattern, href) and platform not in social:
+            for platform, needle in _SOCIAL_LITERALS.items():
+                if platform not in social and needle in href:
                     social[platform] = href
+            # Every platform found: later links can't change anything
+            if len(social) == len(_SOCIAL_LITERALS):
+                break
         
         return social
 
 
-# Singleton instance
-_web_browser_service = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_web_browser_service() -> WebBrowserService:
     """Get or create web browser service singleton"""
-    global _web_browser_service
-    if _web_browser_service is None:
-        _web_browser_service = WebBrowserService()
-    return _web_browser_service
+    return WebBrowserService()
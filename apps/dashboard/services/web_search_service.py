@@ -3,15 +3,177 @@ Web Search Service
 Uses SerpAPI (Google Search) for reliable, accurate results
 Fallback to domain guessing if needed
 """
+import functools
+import hashlib
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, List
 from urllib.parse import urlparse, quote
 import re
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Connections kept alive per host (SerpAPI, DuckDuckGo, guessed domains)
+HTTP_POOL_SIZE = 32
+# Domain guesses HEAD-probed at the same time
+MAX_DOMAIN_PROBES = 10
+# Found websites rarely change; misses are retried sooner in case the company
+# (or our search backends) show up later
+WEBSITE_CACHE_TTL = 60 * 60 * 24 * 7
+WEBSITE_MISS_CACHE_TTL = 60 * 60 * 6
+# Sites that are never a company's own website (social media, job boards, search
+# engines, blog hosts, ...). Matched on whole host labels, so 'amazon.com' skips
+# www.amazon.com but not amazon.company-domain.com
+SKIP_DOMAINS = frozenset([
+    'linkedin.com',
+    'facebook.com',
+    'twitter.com',
+    'instagram.com',
+    'youtube.com',
+    'indeed.com',
+    'glassdoor.com',
+    'monster.com',
+    'ziprecruiter.com',
+    'wikipedia.org',
+    'crunchbase.com',
+    'bloomberg.com',
+    'reuters.com',
+    'ycombinator.com',
+    'reddit.com',
+    'duckduckgo.com',  # Skip DDG internal links
+    'amazon.com',      # Skip Amazon ads
+    'bing.com',        # Skip Bing ads
+    'mapcarta.com',    # Skip map sites
+    'maps.google.com',
+    'openstreetmap.org',
+    'archcompetition.net',  # Skip generic location sites
+    'wework.com',      # Skip coworking spaces
+    'regus.com',
+    'spaces.com',
+    'hubspot.com',     # Skip generic business tools
+    'salesforce.com',
+    'wordpress.com',
+    'medium.com',
+    'blogger.com',
+    'atsmodding.com',  # Skip gaming/mod sites
+    'modland.net',
+    'allmods.net',
+    'ets2world.com',
+    'truckymods.io',
+    'zhihu.com',       # Skip Chinese Q&A site
+    'baidu.com',       # Skip Chinese search engine
+])
+_SKIP_DOMAIN_RE = re.compile(
+    r'(?:^|\.)(?:' + '|'.join(map(re.escape, sorted(SKIP_DOMAINS))) + r')$'
+)
+
+
+def _cache_key(kind: str, *parts: str) -> str:
+    """Cache key for a lookup (hashed: names can exceed backend key limits)"""
+    digest = hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+    return f"web_search:{kind}:{digest}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify(url: str, company_name: str, location: Optional[str]) -> bool:
+    """
+    Check if URL is likely the company's official website
+    Filters out social media, job boards, etc.
+    Prioritizes results matching company location
+
+    Pure over its arguments, so results are memoized: the search backends keep
+    surfacing the same links (LinkedIn, Wikipedia, the official site) for a company
+    """
+    parsed = urlparse(url)
+    domain = parsed.netloc.lower()
+    
+    # Skip if it's a blocked domain
+    if _SKIP_DOMAIN_RE.search(parsed.hostname or ''):
+        logger.debug(f"[SKIP] Domain {domain} is in skip list")
+        return False
+    
+    # Extract key words from company name (ignore common words)
+    ignore_words = ['the', 'inc', 'llc', 'ltd', 'company', 'group', 'international', 'corp', 'corporation', 'biotech', 'medtech', 'hightech', 'talents']
+    company_words = company_name.lower().split()
+    key_words = [w for w in company_words if w not in ignore_words and len(w) > 2]
+    
+    # Clean domain for comparison
+    domain_clean = domain.replace('www.', '').replace('-', '').replace('_', '')
+    
+    # For very short company names (<=4 chars), require exact match in domain
+    company_name_clean = company_name.lower().strip().replace(' ', '').replace('-', '').replace('_', '')
+    if len(company_name_clean) <= 4:
+        # Short name: must match exactly at start of domain
+        matches_name = domain_clean.startswith(company_name_clean + '.')
+        if matches_name:
+            logger.debug(f"[OK] Short name '{company_name_clean}' matches domain '{domain_clean}'")
+        else:
+            logger.debug(f"[SKIP] Short name '{company_name_clean}' does not match domain '{domain_clean}'")
+        return matches_name
+    
+    # Check if any key word appears in domain
+    matches_name = False
+    matched_word = None
+    for word in key_words:
+        word_clean = word.replace('-', '').replace('_', '')
+        if word_clean in domain_clean:
+            matches_name = True
+            matched_word = word_clean
+            break
+    
+    # Also check against full company slug
+    if not matches_name:
+        company_slug = company_name.lower().replace(' ', '').replace('-', '').replace('_', '')
+        if len(company_slug) >= 8 and company_slug[:8] in domain_clean:
+            matches_name = True
+            matched_word = company_slug[:8]
+        elif len(company_slug) < 8 and company_slug in domain_clean:
+            matches_name = True
+            matched_word = company_slug
+    
+    # CRITICAL: Only accept if company name matches domain
+    # No longer accept generic domains just because they have valid TLDs
+    if not matches_name:
+        logger.debug(f"[SKIP] Domain {domain} does not contain company name '{company_name}'")
+        return False
+    
+    logger.debug(f"[MATCH] Domain {domain} contains '{matched_word}' from company name '{company_name}'")
+    
+    # If we have location info, prioritize TLDs matching that location
+    if location:
+        location_lower = location.lower()
+        # Map countries to their TLDs
+        location_tlds = {
+            'belgium': ['.be'],
+            'netherlands': ['.nl'],
+            'germany': ['.de'],
+            'france': ['.fr'],
+            'uk': ['.uk', '.co.uk'],
+            'united kingdom': ['.uk', '.co.uk'],
+            'australia': ['.au', '.com.au'],
+            'canada': ['.ca'],
+            'ireland': ['.ie'],
+            'spain': ['.es'],
+            'italy': ['.it'],
+            'portugal': ['.pt'],
+        }
+        
+        # Check if domain TLD matches location
+        for country, tlds in location_tlds.items():
+            if country in location_lower:
+                for tld in tlds:
+                    if domain.endswith(tld):
+                        logger.info(f"[OK] Domain {domain} matches location {location} (TLD: {tld})")
+                        return True
+    
+    # Name matches - accept it
+    return True
+
 
 class WebSearchService:
     """
@@ -26,6 +188,34 @@ class WebSearchService:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
+        # Every search goes through this session so keep-alive connections (and their
+        # TLS handshakes) are reused across lookups. Only 502/503/504 are retried:
+        # retrying 429s would burn SerpAPI quota or deepen a DuckDuckGo rate limit,
+        # and retrying connect errors / read timeouts would turn one hung 15s
+        # SerpAPI call into three
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=2,
+                connect=0,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=['GET', 'HEAD'],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Guessed domains are HEAD-probed through their own session without any
+        # retries: most guesses don't exist, and each should cost a single timeout
+        self.probe_session = requests.Session()
+        self.probe_session.headers.update(self.session.headers)
+        probe_adapter = HTTPAdapter(pool_connections=MAX_DOMAIN_PROBES, max_retries=0)
+        self.probe_session.mount('http://', probe_adapter)
+        self.probe_session.mount('https://', probe_adapter)
         
         # Get SerpAPI key from settings
         self.serpapi_key = getattr(settings, 'SERPAPI_KEY', None)
@@ -40,12 +230,39 @@ class WebSearchService:
         
         Returns:
             Company website URL or None
+        
+        Results are cached per (company name, location) for WEBSITE_CACHE_TTL so
+        dashboard reloads and retries don't re-hit SerpAPI. Misses are cached too,
+        as '', for the shorter WEBSITE_MISS_CACHE_TTL - but only when every search
+        backend actually answered; a miss caused by an error or rate limit is
+        retried on the next call.
+        """
+        cache_key = _cache_key('website', company_name.lower().strip(), (location or '').lower().strip())
+        website = cache.get(cache_key)
+        if website is None:
+            failures = []
+            website = self._search_company_website(company_name, location, failures)
+            if website:
+                cache.set(cache_key, website, WEBSITE_CACHE_TTL)
+            elif not failures:
+                cache.set(cache_key, '', WEBSITE_MISS_CACHE_TTL)
+            else:
+                logger.info(f"Not caching miss for {company_name}: {', '.join(dict.fromkeys(failures))} failed")
+        return website or None
+    
+    def _search_company_website(self, company_name: str, location: Optional[str] = None,
+                                failures: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Uncached search_company_website
+        
+        Backends that fail (request errors, rate limits) append a description to
+        failures, if given, so callers can tell a real miss from a failed search.
         """
         logger.info(f"Searching web for: {company_name}" + (f" (location: {location})" if location else ""))
         
         # Method 1: Try SerpAPI (Google Search) - Most reliable
         if self.serpapi_key:
-            website = self._serpapi_search(company_name, location)
+            website = self._serpapi_search(company_name, location, failures)
             if website:
                 logger.info(f"Found website via SerpAPI (Google): {website}")
                 return website
@@ -53,7 +270,7 @@ class WebSearchService:
             logger.warning("SerpAPI key not configured, skipping Google search")
         
         # Method 2: Fallback to DuckDuckGo HTML
-        website = self._duckduckgo_search(company_name, location)
+        website = self._duckduckgo_search(company_name, location, failures)
         if website:
             logger.info(f"Found website via DuckDuckGo: {website}")
             return website
@@ -67,13 +284,15 @@ class WebSearchService:
         logger.warning(f"Could not find website for {company_name}")
         return None
     
-    def _serpapi_search(self, company_name: str, location: Optional[str] = None) -> Optional[str]:
+    def _serpapi_search(self, company_name: str, location: Optional[str] = None,
+                        failures: Optional[List[str]] = None) -> Optional[str]:
         """
         Search using SerpAPI (Google Search) - Most reliable method
         
         Args:
             company_name: Company name
             location: Location to include in search (e.g., "Belgium", "Netherlands")
+            failures: If given, a description is appended when the search itself fails
         
         Returns:
             Company website URL or None
@@ -99,11 +318,18 @@ class WebSearchService:
                 'num': 10  # Get top 10 results
             }
             
-            response = requests.get(serpapi_url, params=params, timeout=15)
+            response = self.session.get(serpapi_url, params=params, headers={'Accept': 'application/json'}, timeout=15)
             response.raise_for_status()
             
             data = response.json()
             
+            # SerpAPI reports quota/account problems in the body
+            if data.get('error') and not data.get('organic_results'):
+                logger.error(f"SerpAPI error: {data['error']}")
+                if failures is not None:
+                    failures.append('serpapi')
+                return None
+            
             # Extract organic results
             organic_results = data.get('organic_results', [])
             
@@ -142,9 +368,13 @@ class WebSearchService:
             
         except requests.exceptions.RequestException as e:
             logger.error(f"SerpAPI request failed: {str(e)}")
+            if failures is not None:
+                failures.append('serpapi')
             return None
         except Exception as e:
             logger.error(f"SerpAPI search error: {str(e)}", exc_info=True)
+            if failures is not None:
+                failures.append('serpapi')
             return None
     
     def _google_search(self, company_name: str, location: Optional[str] = None) -> Optional[str]:
@@ -168,7 +398,7 @@ class WebSearchService:
                 'Upgrade-Insecure-Requests': '1'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Parse HTML
@@ -206,10 +436,13 @@ class WebSearchService:
         
         return None
     
-    def _duckduckgo_search(self, company_name: str, location: Optional[str] = None) -> Optional[str]:
+    def _duckduckgo_search(self, company_name: str, location: Optional[str] = None,
+                           failures: Optional[List[str]] = None) -> Optional[str]:
         """
         Search using DuckDuckGo API with multiple methods
         Tries: 1) JSON API, 2) DDGS library, 3) Multiple query variations
+        
+        Failed queries are reported through failures, as in _serpapi_search
         """
         # For short company names, add .com to make search more specific
         search_name = company_name
@@ -233,19 +466,21 @@ class WebSearchService:
             logger.info(f"Search attempt {attempt}/{len(search_queries)}: {query}")
             
             # Method 1: Try DuckDuckGo HTML scraping (most reliable)
-            result = self._duckduckgo_html_search(query, company_name, location)
+            result = self._duckduckgo_html_search(query, company_name, location, failures)
             if result:
                 return result
         
         logger.warning(f"No matching website found after {len(search_queries)} search attempts for '{company_name}'")
         return None
     
-    def _duckduckgo_html_search(self, query: str, company_name: str, location: Optional[str] = None) -> Optional[str]:
+    def _duckduckgo_html_search(self, query: str, company_name: str, location: Optional[str] = None,
+                                failures: Optional[List[str]] = None) -> Optional[str]:
         """
         Search DuckDuckGo by fetching HTML results and parsing links
         This is more reliable than the deprecated duckduckgo-search library
         
         Fetches: https://duckduckgo.com/html/?q=query
+        Request errors and throttling are appended to failures (if given)
         """
         try:
             from bs4 import BeautifulSoup
@@ -272,6 +507,13 @@ class WebSearchService:
             response = self.session.get(search_url, headers=headers, timeout=10)
             response.raise_for_status()
             
+            # DuckDuckGo answers a throttled client with 202 and a challenge page
+            if response.status_code == 202:
+                logger.warning(f"DuckDuckGo throttled the search for: {query}")
+                if failures is not None:
+                    failures.append('duckduckgo')
+                return None
+            
             # Parse HTML
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -343,6 +585,8 @@ class WebSearchService:
             
         except Exception as e:
             logger.warning(f"DuckDuckGo HTML search failed: {str(e)}")
+            if failures is not None:
+                failures.append('duckduckgo')
         
         return None
     
@@ -400,135 +644,9 @@ class WebSearchService:
     
     def _is_likely_company_website(self, url: str, company_name: str, location: Optional[str] = None) -> bool:
         """
-        Check if URL is likely the company's official website
-        Filters out social media, job boards, etc.
-        Prioritizes results matching company location
+        Check if URL is likely the company's official website (see _classify)
         """
-        # Skip these domains
-        skip_domains = [
-            'linkedin.com',
-            'facebook.com', 
-            'twitter.com',
-            'instagram.com',
-            'youtube.com',
-            'indeed.com',
-            'glassdoor.com',
-            'monster.com',
-            'ziprecruiter.com',
-            'wikipedia.org',
-            'crunchbase.com',
-            'bloomberg.com',
-            'reuters.com',
-            'ycombinator.com',
-            'reddit.com',
-            'duckduckgo.com',  # Skip DDG internal links
-            'amazon.com',      # Skip Amazon ads
-            'bing.com',        # Skip Bing ads
-            'mapcarta.com',    # Skip map sites
-            'maps.google.com',
-            'openstreetmap.org',
-            'archcompetition.net',  # Skip generic location sites
-            'wework.com',      # Skip coworking spaces
-            'regus.com',
-            'spaces.com',
-            'hubspot.com',     # Skip generic business tools
-            'salesforce.com',
-            'wordpress.com',
-            'medium.com',
-            'blogger.com',
-            'atsmodding.com',  # Skip gaming/mod sites
-            'modland.net',
-            'allmods.net',
-            'ets2world.com',
-            'truckymods.io',
-            'zhihu.com',       # Skip Chinese Q&A site
-            'baidu.com',       # Skip Chinese search engine
-        ]
-        
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        
-        # Skip if it's a blocked domain
-        if any(skip in domain for skip in skip_domains):
-            logger.debug(f"[SKIP] Domain {domain} is in skip list")
-            return False
-        
-        # Extract key words from company name (ignore common words)
-        ignore_words = ['the', 'inc', 'llc', 'ltd', 'company', 'group', 'international', 'corp', 'corporation', 'biotech', 'medtech', 'hightech', 'talents']
-        company_words = company_name.lower().split()
-        key_words = [w for w in company_words if w not in ignore_words and len(w) > 2]
-        
-        # Clean domain for comparison
-        domain_clean = domain.replace('www.', '').replace('-', '').replace('_', '')
-        
-        # For very short company names (<=4 chars), require exact match in domain
-        company_name_clean = company_name.lower().strip().replace(' ', '').replace('-', '').replace('_', '')
-        if len(company_name_clean) <= 4:
-            # Short name: must match exactly at start of domain
-            matches_name = domain_clean.startswith(company_name_clean + '.')
-            if matches_name:
-                logger.debug(f"[OK] Short name '{company_name_clean}' matches domain '{domain_clean}'")
-            else:
-                logger.debug(f"[SKIP] Short name '{company_name_clean}' does not match domain '{domain_clean}'")
-            return matches_name
-        
-        # Check if any key word appears in domain
-        matches_name = False
-        matched_word = None
-        for word in key_words:
-            word_clean = word.replace('-', '').replace('_', '')
-            if word_clean in domain_clean:
-                matches_name = True
-                matched_word = word_clean
-                break
-        
-        # Also check against full company slug
-        if not matches_name:
-            company_slug = company_name.lower().replace(' ', '').replace('-', '').replace('_', '')
-            if len(company_slug) >= 8 and company_slug[:8] in domain_clean:
-                matches_name = True
-                matched_word = company_slug[:8]
-            elif len(company_slug) < 8 and company_slug in domain_clean:
-                matches_name = True
-                matched_word = company_slug
-        
-        # CRITICAL: Only accept if company name matches domain
-        # No longer accept generic domains just because they have valid TLDs
-        if not matches_name:
-            logger.debug(f"[SKIP] Domain {domain} does not contain company name '{company_name}'")
-            return False
-        
-        logger.debug(f"[MATCH] Domain {domain} contains '{matched_word}' from company name '{company_name}'")
-        
-        # If we have location info, prioritize TLDs matching that location
-        if location:
-            location_lower = location.lower()
-            # Map countries to their TLDs
-            location_tlds = {
-                'belgium': ['.be'],
-                'netherlands': ['.nl'],
-                'germany': ['.de'],
-                'france': ['.fr'],
-                'uk': ['.uk', '.co.uk'],
-                'united kingdom': ['.uk', '.co.uk'],
-                'australia': ['.au', '.com.au'],
-                'canada': ['.ca'],
-                'ireland': ['.ie'],
-                'spain': ['.es'],
-                'italy': ['.it'],
-                'portugal': ['.pt'],
-            }
-            
-            # Check if domain TLD matches location
-            for country, tlds in location_tlds.items():
-                if country in location_lower:
-                    for tld in tlds:
-                        if domain.endswith(tld):
-                            logger.info(f"[OK] Domain {domain} matches location {location} (TLD: {tld})")
-                            return True
-        
-        # Name matches - accept it
-        return True
+        return _classify(url, company_name, location)
     
     def _guess_domain(self, company_name: str, location: Optional[str] = None) -> Optional[str]:
         """
@@ -585,14 +703,29 @@ class WebSearchService:
             f"https://www.{company_slug}.be",
         ])
         
-        for url in patterns:
-            try:
-                response = self.session.head(url, timeout=5, allow_redirects=True)
-                if response.status_code == 200:
-                    return response.url  # Return final URL after redirects
-            except:
-                continue
-        
+        # Probe all candidates at once but keep the list's priority order: worst case
+        # is a couple of probe timeouts instead of one per pattern. Single-word names
+        # produce repeated patterns, which are only probed once
+        patterns = list(dict.fromkeys(patterns))
+        probe_pool = ThreadPoolExecutor(max_workers=MAX_DOMAIN_PROBES, thread_name_prefix="web-search-probe")
+        try:
+            futures = [probe_pool.submit(self._probe_url, url) for url in patterns]
+            for future in futures:
+                final_url = future.result()
+                if final_url:
+                    return final_url
+            return None
+        finally:
+            probe_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _probe_url(self, url: str) -> Optional[str]:
+        """HEAD a candidate URL; the final URL after redirects if it answers 200"""
+        try:
+            response = self.probe_session.head(url, timeout=5, allow_redirects=True)
+            if response.status_code == 200:
+                return response.url
+        except Exception:
+            pass
         return None
     
     def search_company_info(self, company_name: str) -> Dict:
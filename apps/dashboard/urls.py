@@ -15,6 +15,7 @@ urlpatterns = [
     path('api/test-connection/', views.test_connection, name='test_connection'),
     path('api/company-jobs/', views.get_company_jobs, name='company_jobs'),
     path('api/analytics-chat/', views.analytics_chat, name='analytics_chat'),
+    path('api/analytics-chat/stream/', views.analytics_chat_stream, name='analytics_chat_stream'),
     path('companies/contact-details/', views.get_contact_details, name='contact_details'),
     path('companies/research-streaming/', views_ai_research.research_company_streaming, name='research_streaming'),
     path('skills-registry/', views.skills_registry, name='skills_registry'),
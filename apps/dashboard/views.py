@@ -3,7 +3,7 @@ Dashboard Views
 Main dashboard views matching Laravel DashboardController
 """
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
@@ -134,16 +134,7 @@ def analytics_chat(request):
         gemini_service = get_gemini_service()
         
         # Get BigQuery context for AI
-        try:
-            bq_service = get_bigquery_service()
-            stats = bq_service.get_stats()
-            context_data = {
-                'total_jobs': stats.get('total_jobs', 0),
-                'total_companies': stats.get('total_companies', 0),
-                'total_sources': stats.get('total_sources', 0)
-            }
-        except:
-            context_data = {}
+        context_data = _get_chat_context_data()
         
         # Generate AI response
         ai_response = gemini_service.generate_analytics_response(
@@ -169,6 +160,72 @@ def analytics_chat(request):
         }, status=500)
 
 
+@require_http_methods(["POST"])
+def analytics_chat_stream(request):
+    """
+    Streaming AI Analytics Chat endpoint using Gemini
+    Sends the answer as Server-Sent Events while it is being generated
+    """
+    try:
+        data = json.loads(request.body)
+        user_message = data.get('message', '').strip()
+        
+        if not user_message:
+            return JsonResponse({
+                'success': False,
+                'message': 'Please provide a message'
+            }, status=400)
+        
+        gemini_service = get_gemini_service()
+        context_data = _get_chat_context_data()
+        
+        def event_stream():
+            """Generator that yields response chunks"""
+            try:
+                for text in gemini_service.generate_analytics_response_stream(user_message, context_data):
+                    yield f"data: {json.dumps({'status': 'chunk', 'text': text})}\n\n"
+                
+                yield f"data: {json.dumps({'status': 'complete'})}\n\n"
+                
+            except Exception as e:
+                logger.error(f"Analytics chat stream error: {str(e)}")
+                yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+        
+        response = StreamingHttpResponse(
+            event_stream(),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+        
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Invalid JSON data'
+        }, status=400)
+    except Exception as e:
+        logger.error(f"Analytics chat stream error: {str(e)}")
+        return JsonResponse({
+            'success': False,
+            'message': f'Sorry, I encountered an error: {str(e)}'
+        }, status=500)
+
+
+def _get_chat_context_data():
+    """Get BigQuery statistics used as context for the analytics chat"""
+    try:
+        bq_service = get_bigquery_service()
+        stats = bq_service.get_stats()
+        return {
+            'total_jobs': stats.get('total_jobs', 0),
+            'total_companies': stats.get('total_companies', 0),
+            'total_sources': stats.get('total_sources', 0)
+        }
+    except:
+        return {}
+
+
 @require_http_methods(["POST"])
 def get_contact_details(request):
     """
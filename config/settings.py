@@ -226,6 +226,10 @@ DASHBOARD = {
 # =============================================================================
 # OpenAI API
 OPENAI_API_KEY = env('OPENAI_API_KEY', default='')
+OPENAI_MAX_CONCURRENCY = env.int('OPENAI_MAX_CONCURRENCY', default=16)  # Parallel requests in bulk enrichment
+OPENAI_TPM_LIMIT = env.int('OPENAI_TPM_LIMIT', default=0)  # Tokens per minute, 0 = no throttling
+OPENAI_HTTP_POOL_SIZE = env.int('OPENAI_HTTP_POOL_SIZE', default=64)  # Async HTTP connection pool size
+OPENAI_CACHE_TTL = env.int('OPENAI_CACHE_TTL', default=86400)  # Contact-details response cache (seconds)
 
 # AI Provider selection: 'gemini' or 'openai'
 AI_CONTACT_PROVIDER = env('AI_CONTACT_PROVIDER', default='gemini')